@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
 import random
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
-from manifold3d import Manifold
+import numpy as np
+from manifold3d import Manifold, Mesh
 
 from hotel_generator.config import BuildingParams, PrinterProfile
 from hotel_generator.components.base import base_slab
@@ -17,7 +21,7 @@ from hotel_generator.geometry.booleans import union_all
 from hotel_generator.geometry.primitives import BOOLEAN_EMBED
 from hotel_generator.geometry.transforms import translate
 from hotel_generator.settings import Settings
-from hotel_generator.styles.base import STYLE_REGISTRY
+from hotel_generator.styles.base import STYLE_REGISTRY, generate_cached
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +77,10 @@ class HotelBuilder:
         style.validate_style_params(params.style_params)
 
         # 4. Generate building geometry
-        building = style.generate(params, profile)
+        if self.settings.generate_cache:
+            building, cache_hit = generate_cached(style, params, profile)
+        else:
+            building, cache_hit = style.generate(params, profile), False
 
         if building.is_empty():
             raise GeometryError(
@@ -128,5 +135,55 @@ class HotelBuilder:
                 "printer_type": params.printer_type,
                 "generation_time_ms": round(elapsed * 1000),
                 "seed": params.seed,
+                "cache_hit": cache_hit,
             },
         )
+
+
+def _build_mesh_arrays(
+    params: BuildingParams, settings: Settings
+) -> tuple[np.ndarray, np.ndarray]:
+    """Worker for generate_batch: build one hotel, return picklable arrays."""
+    mesh = HotelBuilder(settings).build(params).manifold.to_mesh()
+    return np.asarray(mesh.vert_properties), np.asarray(mesh.tri_verts)
+
+
+def generate_batch(
+    jobs: list[BuildingParams],
+    settings: Settings,
+    max_workers: int | None = None,
+) -> list[Manifold]:
+    """Build many hotels in parallel worker processes.
+
+    Intended for batch workloads (parameter sweeps, dataset generation),
+    not the API. Each job is built with HotelBuilder.build in a separate
+    process; the meshes travel back as vertex/triangle arrays (Manifold
+    itself can't be pickled) and are rebuilt in this process, in job order.
+
+    Args:
+        jobs: Parameters for each hotel.
+        settings: Application settings passed to every worker.
+        max_workers: Worker process count. Defaults to os.cpu_count().
+            manifold3d also multithreads inside each build, so lower this
+            when individual builds are large.
+
+    Workers are started with "spawn": forking after manifold3d has started
+    its worker threads in this process can deadlock the children.
+    """
+    if not jobs:
+        return []
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers == 1:
+        return [HotelBuilder(settings).build(p).manifold for p in jobs]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        results = list(pool.map(_build_mesh_arrays, jobs, [settings] * len(jobs)))
+    return [
+        Manifold(Mesh(
+            vert_properties=np.ascontiguousarray(verts, dtype=np.float32),
+            tri_verts=np.ascontiguousarray(tris, dtype=np.uint32),
+        ))
+        for verts, tris in results
+    ]
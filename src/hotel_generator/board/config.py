@@ -7,6 +7,8 @@ from typing import Any
 
 from pydantic import BaseModel, model_validator
 
+from hotel_generator.errors import InvalidParamsError
+
 
 # ---------------------------------------------------------------------------
 # Garden feature placement
@@ -50,7 +52,6 @@ class PropertyParams(BaseModel):
     @model_validator(mode="after")
     def check_road_edge(self):
         if self.road_edge not in VALID_ROAD_EDGES:
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"road_edge must be one of {VALID_ROAD_EDGES}, got '{self.road_edge}'"
             )
@@ -59,7 +60,6 @@ class PropertyParams(BaseModel):
     @model_validator(mode="after")
     def check_printer_type(self):
         if self.printer_type not in ("fdm", "resin"):
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"printer_type must be 'fdm' or 'resin', got '{self.printer_type}'"
             )
@@ -68,7 +68,6 @@ class PropertyParams(BaseModel):
     @model_validator(mode="after")
     def check_lot_dimensions(self):
         if self.lot_width < 40.0 or self.lot_depth < 30.0:
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"lot must be at least 40x30mm, got {self.lot_width}x{self.lot_depth}"
             )
@@ -114,7 +113,6 @@ class BoardParams(BaseModel):
     @model_validator(mode="after")
     def check_road_shape(self):
         if self.road_shape not in VALID_ROAD_SHAPES:
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"road_shape must be one of {VALID_ROAD_SHAPES}, got '{self.road_shape}'"
             )
@@ -123,7 +121,6 @@ class BoardParams(BaseModel):
     @model_validator(mode="after")
     def check_num_properties(self):
         if self.num_properties < 1 or self.num_properties > 12:
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"num_properties must be 1-12, got {self.num_properties}"
             )
@@ -30,7 +30,7 @@ POOL_SIZES = {
 # Building footprint helpers
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Rect:
     """Axis-aligned rectangle."""
     min_x: float
@@ -28,7 +28,7 @@ from hotel_generator.config import BuildingPlacement, ComplexParams, PrinterProf
 from hotel_generator.errors import GeometryError
 from hotel_generator.geometry.booleans import compose_disjoint, difference_all, union_all
 from hotel_generator.geometry.primitives import BOOLEAN_EMBED, BOOLEAN_OVERSHOOT, box
-from hotel_generator.geometry.transforms import rotate_z, translate
+from hotel_generator.geometry.transforms import compose_transform, transform, translate
 from hotel_generator.settings import Settings
 from hotel_generator.styles.base import STYLE_REGISTRY
 
@@ -109,10 +109,10 @@ class PropertyBuilder:
             )
             adjusted_placements.append(adj_plc)
 
-            m = bld.manifold
-            if plc.rotation != 0:
-                m = rotate_z(m, plc.rotation)
-            m = translate(m, x=plc.x, y=plc.y + bldg_zone_y)
+            m = transform(
+                bld.manifold,
+                compose_transform(plc.x, plc.y + bldg_zone_y, rz=plc.rotation),
+            )
             positioned_buildings.append(m)
 
         # --- 4. Compute garden layout ---
@@ -303,9 +303,7 @@ class PropertyBuilder:
             height = p.get("height", 1.5)
             width = max(p.get("width", 1.0), profile.min_wall_thickness)
             m = hedge_row(length, height, width)
-            if gf.rotation != 0:
-                m = rotate_z(m, gf.rotation)
-            return translate(m, x=gf.x, y=gf.y)
+            return transform(m, compose_transform(gf.x, gf.y, rz=gf.rotation))
 
         elif ft == "pool":
             pool_w = p.get("width", 18.0)
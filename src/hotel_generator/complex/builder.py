@@ -14,7 +14,7 @@ from hotel_generator.config import BuildingParams, BuildingPlacement, ComplexPar
 from hotel_generator.complex.base_plate import complex_base_plate
 from hotel_generator.errors import InvalidParamsError
 from hotel_generator.geometry.booleans import union_all
-from hotel_generator.geometry.transforms import translate, rotate_z, bend_around_z
+from hotel_generator.geometry.transforms import bend_around_z, compose_transform, transform
 from hotel_generator.layout.engine import LayoutEngine
 from hotel_generator.layout.placement import compute_lot_bounds
 from hotel_generator.settings import Settings
@@ -125,10 +125,10 @@ class ComplexBuilder:
             result.manifold = union_all([result.manifold, base])
 
             # 4. Position on lot
-            m = result.manifold
-            if placement.rotation != 0:
-                m = rotate_z(m, placement.rotation)
-            m = translate(m, x=placement.x, y=placement.y)
+            m = transform(
+                result.manifold,
+                compose_transform(placement.x, placement.y, rz=placement.rotation),
+            )
             positioned.append(m)
 
         # 5. Compute lot bounds and generate base plate
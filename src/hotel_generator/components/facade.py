@@ -1,11 +1,44 @@
 """Facade composition — place windows and doors on walls at grid positions."""
 
+import numpy as np
 from manifold3d import Manifold
 
-from hotel_generator.geometry.transforms import translate
+from hotel_generator.geometry.booleans import compose_disjoint, union_all
+from hotel_generator.geometry.transforms import translate_instances
 from hotel_generator.components.window import window_cutout
 
 
+def window_grid_offsets(
+    wall_width: float,
+    num_floors: int,
+    floor_height: float,
+    windows_per_floor: int,
+    window_height: float,
+    first_floor_offset: float = 0.0,
+    ground_floor_skip: bool = True,
+) -> np.ndarray:
+    """Compute window placement offsets for a wall as an (N, 3) array.
+
+    Rows are floor-major (all windows of the lowest floor first) and give
+    the translation for a window template centered on X/Y with base at Z=0.
+    Arguments match window_grid_cutouts().
+    """
+    start_floor = 1 if ground_floor_skip else 0
+    if windows_per_floor <= 0 or start_floor >= num_floors:
+        return np.empty((0, 3))
+
+    # Window centers evenly spaced across wall width, one row per floor
+    spacing = wall_width / (windows_per_floor + 1)
+    xs = -wall_width / 2 + spacing * np.arange(1, windows_per_floor + 1)
+    zs = (
+        np.arange(start_floor, num_floors) * floor_height
+        + first_floor_offset
+        + (floor_height - window_height) / 2
+    )
+    zz, xx = np.meshgrid(zs, xs, indexing="ij")
+    return np.column_stack([xx.ravel(), np.zeros(xx.size), zz.ravel()])
+
+
 def window_grid_cutouts(
     wall_width: float,
     wall_height: float,
@@ -35,22 +68,56 @@ def window_grid_cutouts(
         first_floor_offset: Z offset for ground floor (mm).
         ground_floor_skip: Skip windows on ground floor (for doors).
     """
-    cutouts = []
+    offsets = window_grid_offsets(
+        wall_width,
+        num_floors,
+        floor_height,
+        windows_per_floor,
+        window_height,
+        first_floor_offset=first_floor_offset,
+        ground_floor_skip=ground_floor_skip,
+    )
+    if len(offsets) == 0:
+        return []
 
-    start_floor = 1 if ground_floor_skip else 0
-
-    for floor_idx in range(start_floor, num_floors):
-        # Window centers evenly spaced across wall width
-        spacing = wall_width / (windows_per_floor + 1)
+    cut = window_cutout(window_width, window_height, wall_thickness)
+    return translate_instances(cut, offsets)
 
-        for win_idx in range(windows_per_floor):
-            x_pos = -wall_width / 2 + spacing * (win_idx + 1)
-            z_pos = floor_idx * floor_height + first_floor_offset + (
-                floor_height - window_height
-            ) / 2
 
-            cut = window_cutout(window_width, window_height, wall_thickness)
-            cut = translate(cut, x=x_pos, z=z_pos)
-            cutouts.append(cut)
+def window_stencil(
+    wall_width: float,
+    wall_height: float,
+    wall_thickness: float,
+    num_floors: int,
+    floor_height: float,
+    windows_per_floor: int,
+    window_width: float,
+    window_height: float,
+    first_floor_offset: float = 0.0,
+    ground_floor_skip: bool = True,
+) -> Manifold:
+    """Window grid for one wall as a single Manifold.
 
-    return cutouts
+    Callers translate the whole stencil once per wall instead of each
+    window. When the window pitch leaves a gap both across and between
+    floors the windows are disjoint and are composed; on narrow walls
+    (windows_per_floor never drops below 2) or tall windows they overlap
+    and are unioned instead. Arguments match window_grid_cutouts(); an
+    empty grid returns an empty Manifold.
+    """
+    cutouts = window_grid_cutouts(
+        wall_width,
+        wall_height,
+        wall_thickness,
+        num_floors,
+        floor_height,
+        windows_per_floor,
+        window_width,
+        window_height,
+        first_floor_offset=first_floor_offset,
+        ground_floor_skip=ground_floor_skip,
+    )
+    spacing = wall_width / (windows_per_floor + 1)
+    if spacing > window_width and floor_height > window_height:
+        return compose_disjoint(cutouts)
+    return union_all(cutouts)
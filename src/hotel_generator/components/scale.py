@@ -9,6 +9,7 @@ properties instead of magic numbers.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import ClassVar
 
 from hotel_generator.config import PrinterProfile
@@ -24,7 +25,8 @@ class ScaleContext:
     """Compute scale-appropriate feature dimensions from building params.
 
     All dimensions scale primarily with floor_height, which is the natural
-    "unit of measure" for architectural features.
+    "unit of measure" for architectural features. The context is frozen,
+    so each derived dimension is computed on first access and cached.
     """
 
     width: float
@@ -36,14 +38,14 @@ class ScaleContext:
     # Reference floor height (original Monopoly scale)
     _REF_FLOOR_HEIGHT: ClassVar[float] = 0.8
 
-    @property
+    @cached_property
     def scale_factor(self) -> float:
         """Overall scale factor relative to Monopoly reference."""
         return self.floor_height / self._REF_FLOOR_HEIGHT
 
     # --- Window dimensions ---
 
-    @property
+    @cached_property
     def window_width(self) -> float:
         """Window width, proportional to floor height."""
         return clamp(
@@ -52,7 +54,7 @@ class ScaleContext:
             self.floor_height * 0.7,
         )
 
-    @property
+    @cached_property
     def window_height(self) -> float:
         """Window height, proportional to floor height."""
         return clamp(
@@ -68,7 +70,7 @@ class ScaleContext:
 
     # --- Door dimensions ---
 
-    @property
+    @cached_property
     def door_width(self) -> float:
         """Door width, proportional to floor height."""
         return clamp(
@@ -77,48 +79,48 @@ class ScaleContext:
             self.width * 0.2,
         )
 
-    @property
+    @cached_property
     def door_height(self) -> float:
         """Door height."""
         return self.floor_height * 0.85
 
     # --- Roof and parapet ---
 
-    @property
+    @cached_property
     def roof_overhang(self) -> float:
         """Roof overhang beyond walls."""
         return clamp(self.width * 0.03, 0.1, self.width * 0.08)
 
-    @property
+    @cached_property
     def parapet_height(self) -> float:
         """Parapet wall height above roof."""
         return clamp(self.floor_height * 0.35, 0.15, self.floor_height * 0.6)
 
-    @property
+    @cached_property
     def parapet_wall_thickness(self) -> float:
         """Thickness of parapet walls."""
         return max(self.profile.min_wall_thickness, self.floor_height * 0.15)
 
-    @property
+    @cached_property
     def roof_slab_thickness(self) -> float:
         """Thickness of the roof slab."""
         return clamp(self.floor_height * 0.2, 0.1, self.floor_height * 0.4)
 
     # --- Structural elements ---
 
-    @property
+    @cached_property
     def column_width(self) -> float:
         """Column diameter/width."""
         return max(self.profile.min_column_width, self.floor_height * 0.3)
 
-    @property
+    @cached_property
     def wall_thickness(self) -> float:
         """Standard wall thickness."""
         return max(self.profile.min_wall_thickness, self.floor_height * 0.15)
 
     # --- Decorative elements ---
 
-    @property
+    @cached_property
     def cornice_height(self) -> float:
         """Cornice/entablature detail height."""
         return clamp(
@@ -127,61 +129,61 @@ class ScaleContext:
             self.floor_height * 0.3,
         )
 
-    @property
+    @cached_property
     def entablature_height(self) -> float:
         """Classical entablature height."""
         return self.floor_height * 0.3
 
-    @property
+    @cached_property
     def fin_thickness(self) -> float:
         """Vertical fin thickness (Art Deco)."""
         return max(self.profile.min_feature_size, self.floor_height * 0.15)
 
-    @property
+    @cached_property
     def fin_depth(self) -> float:
         """Vertical fin depth/projection."""
         return clamp(self.floor_height * 0.1, 0.1, self.floor_height * 0.2)
 
-    @property
+    @cached_property
     def setback(self) -> float:
         """Art Deco ziggurat setback per tier."""
         return clamp(self.width * 0.08, 0.3, self.width * 0.12)
 
     # --- Protrusions ---
 
-    @property
+    @cached_property
     def bay_depth(self) -> float:
         """Bay window projection depth."""
         return clamp(self.depth * 0.08, 0.3, self.depth * 0.15)
 
-    @property
+    @cached_property
     def stoop_step_height(self) -> float:
         """Height of a single stoop step."""
         return clamp(self.floor_height * 0.08, 0.2, self.floor_height * 0.15)
 
-    @property
+    @cached_property
     def stoop_step_depth(self) -> float:
         """Depth of a single stoop step."""
         return clamp(self.floor_height * 0.1, 0.2, self.floor_height * 0.2)
 
-    @property
+    @cached_property
     def eave_overhang(self) -> float:
         """Eave/roof overhang for Mediterranean/Tropical styles."""
         return clamp(self.width * 0.06, 0.3, self.width * 0.12)
 
-    @property
+    @cached_property
     def loggia_depth(self) -> float:
         """Loggia/colonnade depth."""
         return clamp(self.depth * 0.06, 0.2, self.depth * 0.12)
 
-    @property
+    @cached_property
     def mansard_inset(self) -> float:
         """Mansard roof inset from walls."""
         return clamp(self.width * 0.08, 0.3, self.width * 0.15)
 
     # --- Turret (Victorian) ---
 
-    @property
+    @cached_property
     def turret_radius(self) -> float:
         """Victorian turret radius."""
         return max(
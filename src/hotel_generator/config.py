@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, field_validator, model_validator
 
+from hotel_generator.errors import InvalidParamsError
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PrinterProfile:
-    """Constraint profile for a specific printer type."""
+    """Constraint profile for a specific printer type.
+
+    Profiles are immutable, so from_type() can hand out one shared
+    instance per printer type.
+    """
 
     # Minimum dimensions (mm)
     min_wall_thickness: float = 0.8
@@ -86,6 +93,7 @@ class PrinterProfile:
         )
 
     @classmethod
+    @lru_cache(maxsize=None)
     def from_type(cls, printer_type: str) -> PrinterProfile:
         """Get profile by printer type string."""
         if printer_type == "fdm":
@@ -93,7 +101,6 @@ class PrinterProfile:
         elif printer_type == "resin":
             return cls.resin()
         else:
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(f"Unknown printer type: {printer_type}")
 
 
@@ -111,22 +118,15 @@ class BuildingParams(BaseModel):
     style_params: dict[str, Any] = {}
 
     @model_validator(mode="after")
-    def check_aspect_ratio(self):
-        """Reject extreme aspect ratios."""
+    def check_all(self):
+        """Reject extreme aspect ratios and unknown printer types."""
         total_height = self.num_floors * self.floor_height
         min_base = min(self.width, self.depth)
         if min_base > 0 and total_height / min_base > 15:
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"Aspect ratio {total_height / min_base:.1f}:1 exceeds maximum 15:1"
             )
-        return self
-
-    @model_validator(mode="after")
-    def check_printer_type(self):
-        """Validate printer type."""
         if self.printer_type not in ("fdm", "resin"):
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"printer_type must be 'fdm' or 'resin', got '{self.printer_type}'"
             )
@@ -150,7 +150,6 @@ class BuildingPlacement(BaseModel):
     def check_role(cls, v: str) -> str:
         valid = ("main", "wing", "annex", "tower", "pavilion")
         if v not in valid:
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"role must be one of {valid}, got '{v}'"
             )
@@ -174,36 +173,21 @@ class ComplexParams(BaseModel):
     bend_angle: float = 0.0  # Degrees to bend the complex around the vertical axis
 
     @model_validator(mode="after")
-    def check_num_buildings(self):
+    def check_all(self):
+        """Validate building count, spacing, printer type, and placements."""
         if self.num_buildings < 1 or self.num_buildings > 6:
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"num_buildings must be 1-6, got {self.num_buildings}"
             )
-        return self
-
-    @model_validator(mode="after")
-    def check_spacing(self):
         if self.building_spacing < 2.0:
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"building_spacing must be >= 2.0mm, got {self.building_spacing}"
             )
-        return self
-
-    @model_validator(mode="after")
-    def check_printer_type(self):
         if self.printer_type not in ("fdm", "resin"):
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"printer_type must be 'fdm' or 'resin', got '{self.printer_type}'"
             )
-        return self
-
-    @model_validator(mode="after")
-    def check_placements_count(self):
         if self.placements is not None and len(self.placements) != self.num_buildings:
-            from hotel_generator.errors import InvalidParamsError
             raise InvalidParamsError(
                 f"placements has {len(self.placements)} entries but "
                 f"num_buildings is {self.num_buildings}"
@@ -8,6 +8,11 @@ from manifold3d import Manifold, OpType
 
 from hotel_generator.errors import GeometryError
 
+# Shared empty result and op lookup. Manifold is immutable from Python,
+# so returning the same empty instance is safe.
+_EMPTY_MANIFOLD = Manifold()
+_ADD = OpType.Add
+
 
 def _filter_empty(parts: list[Manifold]) -> list[Manifold]:
     """Remove empty manifolds from a list."""
@@ -21,10 +26,10 @@ def union_all(parts: list[Manifold]) -> Manifold:
     """
     valid = _filter_empty(parts)
     if not valid:
-        return Manifold()
+        return _EMPTY_MANIFOLD
     if len(valid) == 1:
         return valid[0]
-    return Manifold.batch_boolean(valid, OpType.Add)
+    return Manifold.batch_boolean(valid, _ADD)
 
 
 def difference_all(base: Manifold, cutouts: list[Manifold]) -> Manifold:
@@ -39,9 +44,11 @@ def difference_all(base: Manifold, cutouts: list[Manifold]) -> Manifold:
         return base
     # batch_boolean takes [base, cutout1, cutout2, ...] with OpType.Subtract
     # but that subtracts each sequentially. Use union of cutouts then single subtract.
-    cutter = union_all(valid_cutouts)
-    if cutter.is_empty():
-        return base
+    # The cutouts are already filtered, so skip union_all's second pass.
+    if len(valid_cutouts) == 1:
+        cutter = valid_cutouts[0]
+    else:
+        cutter = Manifold.batch_boolean(valid_cutouts, _ADD)
     return base - cutter
 
 
@@ -53,7 +60,7 @@ def compose_disjoint(parts: list[Manifold]) -> Manifold:
     """
     valid = _filter_empty(parts)
     if not valid:
-        return Manifold()
+        return _EMPTY_MANIFOLD
     if len(valid) == 1:
         return valid[0]
     return Manifold.compose(valid)
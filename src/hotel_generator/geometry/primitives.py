@@ -4,6 +4,7 @@ All primitives validate inputs and raise GeometryError on invalid dimensions.
 """
 
 import math
+from functools import lru_cache
 
 import numpy as np
 from manifold3d import CrossSection, Manifold
@@ -22,6 +23,29 @@ def _check_positive(value: float, name: str) -> None:
         raise GeometryError(f"{name} must be positive, got {value}")
 
 
+# Primitives are rebuilt with the same handful of dimensions over and over
+# (floor slabs, window cutters, columns). Manifold objects are immutable
+# from Python -- every operation returns a new one -- so a cached instance
+# can be handed out to any number of callers. Don't rely on identity
+# comparisons between returned primitives.
+@lru_cache(maxsize=256)
+def _cached_box(width: float, depth: float, height: float) -> Manifold:
+    # cube + translate benchmarks faster than extruding a centered
+    # CrossSection in manifold3d 3.5 (the translate is a lazy transform).
+    return Manifold.cube([width, depth, height]).translate(
+        [-width / 2, -depth / 2, 0]
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_cylinder(
+    height: float, r_bottom: float, r_top: float, segments: int | None
+) -> Manifold:
+    if segments is not None:
+        return Manifold.cylinder(height, r_bottom, r_top, circular_segments=segments)
+    return Manifold.cylinder(height, r_bottom, r_top)
+
+
 def box(width: float, depth: float, height: float) -> Manifold:
     """Create a box centered on X/Y with base at Z=0.
 
@@ -33,9 +57,33 @@ def box(width: float, depth: float, height: float) -> Manifold:
     _check_positive(width, "width")
     _check_positive(depth, "depth")
     _check_positive(height, "height")
-    return Manifold.cube([width, depth, height]).translate(
-        [-width / 2, -depth / 2, 0]
-    )
+    return _cached_box(width, depth, height)
+
+
+def box_at(
+    width: float,
+    depth: float,
+    height: float,
+    x: float = 0.0,
+    y: float = 0.0,
+    z: float = 0.0,
+) -> Manifold:
+    """Create a box centered on (x, y) with its base at Z=z.
+
+    Equivalent to translate(box(width, depth, height), x, y, z) in a
+    single call.
+
+    Args:
+        width: Size along X axis (mm).
+        depth: Size along Y axis (mm).
+        height: Size along Z axis (mm).
+        x, y: Center of the base (mm).
+        z: Base height (mm).
+    """
+    _check_positive(width, "width")
+    _check_positive(depth, "depth")
+    _check_positive(height, "height")
+    return _cached_box(width, depth, height).translate([x, y, z])
 
 
 def cylinder(
@@ -50,9 +98,7 @@ def cylinder(
     """
     _check_positive(radius, "radius")
     _check_positive(height, "height")
-    if segments is not None:
-        return Manifold.cylinder(height, radius, circular_segments=segments)
-    return Manifold.cylinder(height, radius)
+    return _cached_cylinder(height, radius, radius, segments)
 
 
 def cone(
@@ -73,11 +119,7 @@ def cone(
     if r_top < 0:
         raise GeometryError(f"r_top must be non-negative, got {r_top}")
     _check_positive(height, "height")
-    if segments is not None:
-        return Manifold.cylinder(
-            height, r_bottom, r_top, circular_segments=segments
-        )
-    return Manifold.cylinder(height, r_bottom, r_top)
+    return _cached_cylinder(height, r_bottom, r_top, segments)
 
 
 def extrude_polygon(points: list[tuple[float, float]], height: float) -> Manifold:
@@ -9,12 +9,57 @@ import math
 import numpy as np
 from manifold3d import Manifold
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to plain NumPy
+    njit = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _bend_kernel(verts, out, center_x, width, bend_angle, bend_radius):
+        for i in prange(verts.shape[0]):
+            theta = (verts[i, 0] - center_x) / width * bend_angle
+            r = bend_radius + verts[i, 1]
+            out[i, 0] = r * math.sin(theta)
+            out[i, 1] = r * math.cos(theta) - bend_radius
+            out[i, 2] = verts[i, 2]
+
+else:
+
+    def _bend_kernel(verts, out, center_x, width, bend_angle, bend_radius):
+        # Normalized position along width (-0.5 to 0.5) scaled to an angle.
+        # Work in place on the output columns to keep temporaries down.
+        theta = verts[:, 0] - center_x
+        theta *= bend_angle / width
+        r = verts[:, 1] + bend_radius
+        np.sin(theta, out=out[:, 0])
+        out[:, 0] *= r
+        np.cos(theta, out=out[:, 1])
+        out[:, 1] *= r
+        out[:, 1] -= bend_radius
+        out[:, 2] = verts[:, 2]
+
 
 def translate(solid: Manifold, x: float = 0, y: float = 0, z: float = 0) -> Manifold:
-    """Translate a manifold by (x, y, z)."""
+    """Translate a manifold by (x, y, z). A zero offset returns solid as is."""
+    if x == 0 and y == 0 and z == 0:
+        return solid
     return solid.translate([x, y, z])
 
 
+def translate_instances(template: Manifold, offsets: np.ndarray) -> list[Manifold]:
+    """Place copies of one template at each (x, y, z) row of offsets.
+
+    Args:
+        template: Solid to copy; shared by every instance.
+        offsets: Array-like of shape (N, 3) with translation vectors (mm).
+    """
+    offsets = np.asarray(offsets, dtype=np.float64).reshape(-1, 3)
+    return [template.translate(o) for o in offsets.tolist()]
+
+
 def rotate_x(solid: Manifold, degrees: float) -> Manifold:
     """Rotate a manifold around the X axis."""
     return solid.rotate([degrees, 0, 0])
@@ -40,14 +85,58 @@ def mirror_y(solid: Manifold) -> Manifold:
     return solid.mirror([0, 1, 0])
 
 
+def _cos_sin_degrees(degrees: float) -> tuple[float, float]:
+    """Cosine and sine of an angle, exact for multiples of 90 degrees."""
+    if float(degrees).is_integer() and int(degrees) % 90 == 0:
+        quadrant = (int(degrees) // 90) % 4
+        return ((1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0))[quadrant]
+    rad = math.radians(degrees)
+    return math.cos(rad), math.sin(rad)
+
+
+def compose_transform(
+    tx: float = 0.0,
+    ty: float = 0.0,
+    tz: float = 0.0,
+    rz: float = 0.0,
+    sx: float = 1.0,
+    sy: float = 1.0,
+    sz: float = 1.0,
+) -> np.ndarray:
+    """Build a 3x4 affine matrix: scale, then rotate about Z, then translate.
+
+    Args:
+        tx, ty, tz: Translation applied last (mm).
+        rz: Rotation about the Z axis in degrees.
+        sx, sy, sz: Per-axis scale applied first.
+    """
+    c, s = _cos_sin_degrees(rz)
+    return np.array(
+        [
+            [c * sx, -s * sy, 0.0, tx],
+            [s * sx, c * sy, 0.0, ty],
+            [0.0, 0.0, sz, tz],
+        ],
+        dtype=np.float64,
+    )
+
+
+def transform(solid: Manifold, matrix: np.ndarray) -> Manifold:
+    """Apply a 3x4 affine matrix (see compose_transform) in a single call."""
+    return solid.transform(matrix)
+
+
 def safe_scale(
     solid: Manifold, sx: float = 1.0, sy: float = 1.0, sz: float = 1.0
 ) -> Manifold:
     """Scale a manifold using the 3-vector form.
 
     NEVER use Manifold.scale(float) — it crashes in manifold3d 3.3.2.
-    This function always passes [sx, sy, sz].
+    This function always passes [sx, sy, sz]. An identity scale returns
+    solid unchanged.
     """
+    if sx == 1.0 and sy == 1.0 and sz == 1.0:
+        return solid
     return solid.scale([sx, sy, sz])
 
 
@@ -97,17 +186,8 @@ def bend_around_z(
 
     # Vectorized warp: map X to angle, Y to radial offset
     def _warp_batch(verts: np.ndarray) -> np.ndarray:
-        x = verts[:, 0]
-        y = verts[:, 1]
-        z = verts[:, 2]
-
-        # Normalized position along width: -0.5 to 0.5
-        t = (x - center_x) / width
-        theta = t * bend_angle
-
-        r = bend_radius + y
-        new_x = r * np.sin(theta)
-        new_y = r * np.cos(theta) - bend_radius
-        return np.column_stack([new_x, new_y, z])
+        out = np.empty_like(verts)
+        _bend_kernel(verts, out, center_x, width, bend_angle, bend_radius)
+        return out
 
     return refined.warp_batch(_warp_batch)
@@ -5,10 +5,12 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
 from hotel_generator.config import BuildingPlacement
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BuildingFootprint:
     """Axis-aligned bounding box of a placed building."""
 
@@ -64,14 +66,38 @@ def footprints_overlap(a: BuildingFootprint, b: BuildingFootprint, margin: float
     )
 
 
+def footprints_table(placements: list[BuildingPlacement]) -> np.ndarray:
+    """Compute AABB footprints for all placements as an (N, 4) array.
+
+    Rows are [min_x, min_y, max_x, max_y]. Same rotation handling as
+    placement_footprint().
+    """
+    data = np.array(
+        [(p.x, p.y, p.width, p.depth, p.rotation) for p in placements],
+        dtype=np.float64,
+    ).reshape(-1, 5)
+    xy = data[:, :2]
+    rot = data[:, 4] % 360
+    swapped = (rot == 90) | (rot == 270)
+    half_w = np.where(swapped, data[:, 3], data[:, 2]) / 2
+    half_d = np.where(swapped, data[:, 2], data[:, 3]) / 2
+    half = np.column_stack([half_w, half_d])
+    return np.hstack([xy - half, xy + half])
+
+
 def any_overlaps(placements: list[BuildingPlacement], margin: float = 0.0) -> bool:
     """Check if any placements overlap each other."""
-    footprints = [placement_footprint(p) for p in placements]
-    for i in range(len(footprints)):
-        for j in range(i + 1, len(footprints)):
-            if footprints_overlap(footprints[i], footprints[j], margin):
-                return True
-    return False
+    if len(placements) < 2:
+        return False
+    a = footprints_table(placements)
+    # Pairwise separation test, broadcast over all (i, j)
+    separated = (
+        (a[:, None, 2] + margin <= a[None, :, 0])
+        | (a[None, :, 2] + margin <= a[:, None, 0])
+        | (a[:, None, 3] + margin <= a[None, :, 1])
+        | (a[None, :, 3] + margin <= a[:, None, 1])
+    )
+    return bool(np.triu(~separated, 1).any())
 
 
 def compute_lot_bounds(placements: list[BuildingPlacement], margin: float = 2.0) -> tuple[float, float]:
@@ -81,12 +107,10 @@ def compute_lot_bounds(placements: list[BuildingPlacement], margin: float = 2.0)
     """
     if not placements:
         return (0.0, 0.0)
-    footprints = [placement_footprint(p) for p in placements]
-    min_x = min(f.min_x for f in footprints) - margin
-    min_y = min(f.min_y for f in footprints) - margin
-    max_x = max(f.max_x for f in footprints) + margin
-    max_y = max(f.max_y for f in footprints) + margin
-    return (max_x - min_x, max_y - min_y)
+    a = footprints_table(placements)
+    min_x, min_y = a[:, :2].min(axis=0) - margin
+    max_x, max_y = a[:, 2:].max(axis=0) + margin
+    return (float(max_x - min_x), float(max_y - min_y))
 
 
 def footprints_fit_lot(
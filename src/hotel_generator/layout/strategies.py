@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import math
 import random
+from functools import lru_cache
 from typing import Sequence
 
+import numpy as np
+
 from hotel_generator.config import BuildingPlacement
 
 
@@ -43,19 +47,43 @@ def _apply_role_sizing(
     return base_width * wf, base_depth * df, floors, floor_height
 
 
-def _default_roles(num_buildings: int, roles: Sequence[str] | None = None) -> list[str]:
-    """Generate default roles if not specified."""
+def _build_sizes(
+    role_list: Sequence[str],
+    base_width: float,
+    base_depth: float,
+    base_floors: int,
+    floor_height: float,
+    size_hints: dict[str, dict[str, float]] | None = None,
+) -> list[tuple[float, float, int, float]]:
+    """Apply role sizing to every role once, returning (w, d, floors, fh) rows."""
+    return [
+        _apply_role_sizing(role, base_width, base_depth, base_floors, floor_height, size_hints)
+        for role in role_list
+    ]
+
+
+@lru_cache(maxsize=64)
+def _default_roles_cached(num_buildings: int, roles: tuple[str, ...] | None) -> tuple[str, ...]:
     if roles:
-        return list(roles[:num_buildings])
+        return roles[:num_buildings]
     if num_buildings == 1:
-        return ["main"]
+        return ("main",)
     result = ["main"]
     for i in range(1, num_buildings):
         if i <= 2:
             result.append("wing")
         else:
             result.append("annex")
-    return result
+    return tuple(result)
+
+
+def _default_roles(num_buildings: int, roles: Sequence[str] | None = None) -> tuple[str, ...]:
+    """Generate default roles if not specified.
+
+    Memoized on (num_buildings, roles); returns an immutable tuple so the
+    cached value can be shared safely.
+    """
+    return _default_roles_cached(num_buildings, tuple(roles) if roles else None)
 
 
 def row_layout(
@@ -72,15 +100,12 @@ def row_layout(
     """Buildings in a row along the X axis, main centered."""
     role_list = _default_roles(num_buildings, roles)
     placements = []
-    sizes = []
-    for role in role_list:
-        w, d, floors, fh = _apply_role_sizing(role, base_width, base_depth, base_floors, floor_height, size_hints)
-        sizes.append((w, d, floors, fh, role))
+    sizes = _build_sizes(role_list, base_width, base_depth, base_floors, floor_height, size_hints)
 
     total_width = sum(s[0] for s in sizes) + spacing * (num_buildings - 1)
     x = -total_width / 2
 
-    for w, d, floors, fh, role in sizes:
+    for (w, d, floors, fh), role in zip(sizes, role_list):
         placements.append(BuildingPlacement(
             x=x + w / 2,
             y=0.0,
@@ -110,9 +135,10 @@ def courtyard_layout(
     """Buildings arranged around a courtyard (U or C shape)."""
     role_list = _default_roles(num_buildings, roles)
     placements = []
+    sizes = _build_sizes(role_list, base_width, base_depth, base_floors, floor_height, size_hints)
 
     # Main building at the back
-    w0, d0, f0, fh0 = _apply_role_sizing(role_list[0], base_width, base_depth, base_floors, floor_height, size_hints)
+    w0, d0, f0, fh0 = sizes[0]
     placements.append(BuildingPlacement(
         x=0.0, y=d0 / 2 + spacing / 2,
         width=w0, depth=d0, num_floors=f0, floor_height=fh0, role=role_list[0],
@@ -120,7 +146,7 @@ def courtyard_layout(
 
     if num_buildings >= 2:
         # Left wing
-        w1, d1, f1, fh1 = _apply_role_sizing(role_list[1], base_width, base_depth, base_floors, floor_height, size_hints)
+        w1, d1, f1, fh1 = sizes[1]
         placements.append(BuildingPlacement(
             x=-w0 / 2 - spacing / 2 - d1 / 2, y=0.0,
             rotation=90.0,
@@ -129,7 +155,7 @@ def courtyard_layout(
 
     if num_buildings >= 3:
         # Right wing
-        w2, d2, f2, fh2 = _apply_role_sizing(role_list[2], base_width, base_depth, base_floors, floor_height, size_hints)
+        w2, d2, f2, fh2 = sizes[2]
         placements.append(BuildingPlacement(
             x=w0 / 2 + spacing / 2 + d2 / 2, y=0.0,
             rotation=90.0,
@@ -138,7 +164,7 @@ def courtyard_layout(
 
     if num_buildings >= 4:
         # Front building (closing the courtyard)
-        w3, d3, f3, fh3 = _apply_role_sizing(role_list[3], base_width, base_depth, base_floors, floor_height, size_hints)
+        w3, d3, f3, fh3 = sizes[3]
         placements.append(BuildingPlacement(
             x=0.0, y=-d3 / 2 - spacing / 2,
             width=w3, depth=d3, num_floors=f3, floor_height=fh3, role=role_list[3],
@@ -146,7 +172,7 @@ def courtyard_layout(
 
     # Extra buildings behind or beside the courtyard
     for i in range(4, num_buildings):
-        wi, di, fi, fhi = _apply_role_sizing(role_list[i], base_width, base_depth, base_floors, floor_height, size_hints)
+        wi, di, fi, fhi = sizes[i]
         # Place behind the main building
         extra_idx = i - 4
         y_back = d0 / 2 + spacing / 2 + d0 + spacing + di / 2 + extra_idx * (di + spacing)
@@ -172,9 +198,10 @@ def hierarchical_layout(
     """One dominant building with flanking shorter buildings."""
     role_list = _default_roles(num_buildings, roles)
     placements = []
+    sizes = _build_sizes(role_list, base_width, base_depth, base_floors, floor_height, size_hints)
 
     # Main building centered
-    w0, d0, f0, fh0 = _apply_role_sizing(role_list[0], base_width, base_depth, base_floors, floor_height, size_hints)
+    w0, d0, f0, fh0 = sizes[0]
     placements.append(BuildingPlacement(
         x=0.0, y=0.0,
         width=w0, depth=d0, num_floors=f0, floor_height=fh0, role=role_list[0],
@@ -182,7 +209,7 @@ def hierarchical_layout(
 
     # Flanking buildings symmetrically
     for i in range(1, num_buildings):
-        wi, di, fi, fhi = _apply_role_sizing(role_list[i], base_width, base_depth, base_floors, floor_height, size_hints)
+        wi, di, fi, fhi = sizes[i]
         side = -1 if i % 2 == 1 else 1
         pair_idx = (i + 1) // 2
         x_offset = side * (w0 / 2 + spacing + wi / 2) * pair_idx
@@ -214,29 +241,25 @@ def cluster_layout(
         role_list = list(roles[:num_buildings])
 
     placements = []
+    sizes = _build_sizes(role_list, base_width, base_depth, base_floors, floor_height, size_hints)
 
     # Main building centered
-    w0, d0, f0, fh0 = _apply_role_sizing(role_list[0], base_width, base_depth, base_floors, floor_height, size_hints)
+    w0, d0, f0, fh0 = sizes[0]
     placements.append(BuildingPlacement(
         x=0.0, y=0.0,
         width=w0, depth=d0, num_floors=f0, floor_height=fh0, role=role_list[0],
     ))
 
     # Scatter pavilions in a ring around the main building
-    import math
-    # Compute sizes first to determine proper radius
-    pav_sizes = []
-    for i in range(1, num_buildings):
-        wi, di, fi, fhi = _apply_role_sizing(role_list[i], base_width, base_depth, base_floors, floor_height, size_hints)
-        pav_sizes.append((wi, di, fi, fhi))
+    pav_sizes = sizes[1:]
 
     max_pav = max((max(w, d) for w, d, _, _ in pav_sizes), default=0)
     radius = max(w0, d0) / 2 + max_pav / 2 + spacing * 2
-    angle_start = rng.uniform(0, math.pi / 4)
-    for i, (wi, di, fi, fhi) in enumerate(pav_sizes):
-        angle = angle_start + (2 * math.pi * i) / max(1, num_buildings - 1)
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
+    angle_start = rng.uniform(0, np.pi / 4)
+    angles = angle_start + (2 * np.pi * np.arange(len(pav_sizes))) / max(1, num_buildings - 1)
+    xs = (radius * np.cos(angles)).tolist()
+    ys = (radius * np.sin(angles)).tolist()
+    for i, ((wi, di, fi, fhi), x, y) in enumerate(zip(pav_sizes, xs, ys)):
         placements.append(BuildingPlacement(
             x=x, y=y, rotation=0.0,
             width=wi, depth=di, num_floors=fi, floor_height=fhi, role=role_list[i + 1],
@@ -260,14 +283,10 @@ def campus_layout(
     role_list = _default_roles(num_buildings, roles)
     placements = []
 
-    import math
-    cols = math.ceil(math.sqrt(num_buildings))
-    rows = math.ceil(num_buildings / cols)
+    cols = math.isqrt(num_buildings - 1) + 1  # ceil(sqrt(n)) without floats
+    rows = (num_buildings + cols - 1) // cols
 
-    sizes = []
-    for role in role_list:
-        w, d, floors, fh = _apply_role_sizing(role, base_width, base_depth, base_floors, floor_height, size_hints)
-        sizes.append((w, d, floors, fh, role))
+    sizes = _build_sizes(role_list, base_width, base_depth, base_floors, floor_height, size_hints)
 
     max_w = max(s[0] for s in sizes)
     max_d = max(s[1] for s in sizes)
@@ -277,19 +296,15 @@ def campus_layout(
     total_w = cols * cell_w - spacing
     total_d = rows * cell_d - spacing
 
-    idx = 0
-    for row in range(rows):
-        for col in range(cols):
-            if idx >= num_buildings:
-                break
-            w, d, floors, fh, role = sizes[idx]
-            x = -total_w / 2 + col * cell_w + cell_w / 2 - spacing / 2
-            y = -total_d / 2 + row * cell_d + cell_d / 2 - spacing / 2
-            placements.append(BuildingPlacement(
-                x=x, y=y,
-                width=w, depth=d, num_floors=floors, floor_height=fh, role=role,
-            ))
-            idx += 1
+    # Row-major grid cells for every building at once
+    row_i, col_i = np.divmod(np.arange(num_buildings), cols)
+    xs = (-total_w / 2 + col_i * cell_w + cell_w / 2 - spacing / 2).tolist()
+    ys = (-total_d / 2 + row_i * cell_d + cell_d / 2 - spacing / 2).tolist()
+    for (w, d, floors, fh), role, x, y in zip(sizes, role_list, xs, ys):
+        placements.append(BuildingPlacement(
+            x=x, y=y,
+            width=w, depth=d, num_floors=floors, floor_height=fh, role=role,
+        ))
 
     return placements
 
@@ -309,10 +324,13 @@ def l_layout(
     role_list = _default_roles(num_buildings, roles)
     placements = []
 
-    sizes = []
-    for role in role_list:
-        w, d, floors, fh = _apply_role_sizing(role, base_width, base_depth, base_floors, floor_height, size_hints)
-        sizes.append((w, d, floors, fh, role))
+    sizes = [
+        (*size, role)
+        for size, role in zip(
+            _build_sizes(role_list, base_width, base_depth, base_floors, floor_height, size_hints),
+            role_list,
+        )
+    ]
 
     # First building at the corner
     w0, d0, f0, fh0, r0 = sizes[0]
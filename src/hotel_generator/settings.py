@@ -13,3 +13,6 @@ class Settings(BaseSettings):
     cors_origins: list[str] = ["*"]
     log_level: str = "INFO"
     max_triangles: int = 200_000
+    # Reuse generated buildings for identical params (see generate_cached).
+    # Off by default so every build runs the full pipeline.
+    generate_cache: bool = False
@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
-import random
 from typing import Any
 
+import numpy as np
 from manifold3d import Manifold
 
 from hotel_generator.config import BuildingParams, PrinterProfile
-from hotel_generator.geometry.primitives import box, BOOLEAN_EMBED, BOOLEAN_OVERSHOOT
-from hotel_generator.geometry.transforms import translate
+from hotel_generator.geometry.booleans import compose_disjoint
+from hotel_generator.geometry.primitives import box, box_at, BOOLEAN_EMBED, BOOLEAN_OVERSHOOT
+from hotel_generator.geometry.transforms import translate, translate_instances
 from hotel_generator.components.massing import stepped_mass
 from hotel_generator.components.roof import flat_roof
-from hotel_generator.components.facade import window_grid_cutouts
+from hotel_generator.components.facade import window_stencil
 from hotel_generator.components.door import door_cutout
 from hotel_generator.components.scale import ScaleContext
 from hotel_generator.styles.base import GardenTheme, HotelStyle, register_style, assemble_building
@@ -48,7 +49,6 @@ class ArtDecoStyle(HotelStyle):
         )
 
     def generate(self, params: BuildingParams, profile: PrinterProfile) -> Manifold:
-        rng = random.Random(params.seed)
         w = params.width
         d = params.depth
         num_floors = max(params.num_floors, 6)
@@ -77,20 +77,20 @@ class ArtDecoStyle(HotelStyle):
             tier_wins = sc.windows_per_floor(tier_w)
 
             # Front and back windows for this tier
+            stencil = window_stencil(
+                wall_width=tier_w,
+                wall_height=tier_h,
+                wall_thickness=wall_t,
+                num_floors=tier_floors,
+                floor_height=fh,
+                windows_per_floor=tier_wins,
+                window_width=win_w,
+                window_height=win_h,
+                first_floor_offset=tier_base_z,
+                ground_floor_skip=(tier == 0),
+            )
             for y_sign in [-1, 1]:
-                cuts = window_grid_cutouts(
-                    wall_width=tier_w,
-                    wall_height=tier_h,
-                    wall_thickness=wall_t,
-                    num_floors=tier_floors,
-                    floor_height=fh,
-                    windows_per_floor=tier_wins,
-                    window_width=win_w,
-                    window_height=win_h,
-                    ground_floor_skip=(tier == 0),
-                )
-                for c in cuts:
-                    cutouts.append(translate(c, y=y_sign * tier_d / 2, z=tier_base_z))
+                cutouts.append(translate(stencil, y=y_sign * tier_d / 2))
 
         # Door
         door_w = sc.door_width
@@ -107,25 +107,30 @@ class ArtDecoStyle(HotelStyle):
         fin_d = sc.fin_depth
         num_fins = 4
         fin_spacing = w / (num_fins + 1)
-        for i in range(num_fins):
-            fin = box(fin_t, fin_d, total_h * 0.7)
-            x_pos = -w / 2 + fin_spacing * (i + 1)
-            fin = translate(fin, x=x_pos, y=-d / 2 - fin_d / 2 + BOOLEAN_EMBED)
-            additions.append(fin)
+        fin = box(fin_t, fin_d, total_h * 0.7)
+        fin_offsets = np.zeros((num_fins, 3))
+        fin_offsets[:, 0] = -w / 2 + fin_spacing * np.arange(1, num_fins + 1)
+        fin_offsets[:, 1] = -d / 2 - fin_d / 2 + BOOLEAN_EMBED
+        fins = translate_instances(fin, fin_offsets)
+        # Fins with a gap between them compose into one strip in O(1); on
+        # narrow walls or tall floors they touch or overlap, so they go into
+        # the additions union individually
+        if fin_spacing > fin_t:
+            additions.append(compose_disjoint(fins))
+        else:
+            additions.extend(fins)
 
         # Geometric crown at top
         crown_w = (w - 2 * setback * (num_tiers - 1)) * 0.5
         crown_d = (d - 2 * setback * (num_tiers - 1)) * 0.5
         crown_h = fh * 0.5
-        crown = box(crown_w, crown_d, crown_h)
-        crown = translate(crown, z=total_h - BOOLEAN_EMBED)
+        crown = box_at(crown_w, crown_d, crown_h, z=total_h - BOOLEAN_EMBED)
         additions.append(crown)
 
         # Small spire on top of crown
         spire_w = crown_w * 0.3
         spire_h = fh * 0.6
-        spire = box(spire_w, spire_w, spire_h)
-        spire = translate(spire, z=total_h + crown_h - BOOLEAN_EMBED)
+        spire = box_at(spire_w, spire_w, spire_h, z=total_h + crown_h - BOOLEAN_EMBED)
         additions.append(spire)
 
         return assemble_building(shell, cutouts, additions)
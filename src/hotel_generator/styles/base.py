@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import abc
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from dataclasses import astuple, dataclass, field
 from typing import Any
 
 from manifold3d import Manifold
@@ -13,7 +15,7 @@ from hotel_generator.errors import GeometryError, InvalidParamsError
 from hotel_generator.geometry.booleans import union_all, difference_all
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GardenTheme:
     """Configuration for a style's garden/leisure area aesthetics."""
 
@@ -30,11 +32,17 @@ class GardenTheme:
 # Global style registry
 STYLE_REGISTRY: dict[str, HotelStyle] = {}
 
+# Bumped on every registration so list_styles() knows when to rebuild
+_registry_version = 0
+_style_list_cache: tuple[int, list[dict]] | None = None
+
 
 def register_style(cls: type[HotelStyle]) -> type[HotelStyle]:
     """Decorator to register a style class in STYLE_REGISTRY."""
+    global _registry_version
     instance = cls()
     STYLE_REGISTRY[instance.name] = instance
+    _registry_version += 1
     return cls
 
 
@@ -88,8 +96,15 @@ class HotelStyle(abc.ABC):
 
 
 def list_styles() -> list[dict]:
-    """List all registered styles with metadata."""
-    return [
+    """List all registered styles with metadata.
+
+    The list is built once and reused until another style is registered;
+    callers must not mutate it.
+    """
+    global _style_list_cache
+    if _style_list_cache is not None and _style_list_cache[0] == _registry_version:
+        return _style_list_cache[1]
+    styles = [
         {
             "name": style.name,
             "display_name": style.display_name,
@@ -98,6 +113,46 @@ def list_styles() -> list[dict]:
         }
         for style in STYLE_REGISTRY.values()
     ]
+    _style_list_cache = (_registry_version, styles)
+    return styles
+
+
+# Small LRU of generated buildings. Manifold is immutable, so a cached
+# result can be handed to any number of callers (preview then export,
+# repeated API calls with identical params).
+_GENERATE_CACHE_MAX = 32
+_generate_cache: OrderedDict[tuple, Manifold] = OrderedDict()
+_generate_cache_lock = threading.Lock()
+
+
+def generate_cached(
+    style: HotelStyle, params: BuildingParams, profile: PrinterProfile
+) -> tuple[Manifold, bool]:
+    """Call style.generate(), reusing the result for identical inputs.
+
+    Returns (manifold, cache_hit). The key covers the style name, every
+    BuildingParams field and every PrinterProfile field. Failed
+    generations are not cached. HotelBuilder only uses this when
+    Settings.generate_cache is enabled.
+    """
+    key = (style.name, params.model_dump_json(), astuple(profile))
+    with _generate_cache_lock:
+        cached = _generate_cache.get(key)
+        if cached is not None:
+            _generate_cache.move_to_end(key)
+            return cached, True
+    result = style.generate(params, profile)
+    with _generate_cache_lock:
+        _generate_cache[key] = result
+        if len(_generate_cache) > _GENERATE_CACHE_MAX:
+            _generate_cache.popitem(last=False)
+    return result, False
+
+
+def clear_generate_cache() -> None:
+    """Drop all cached buildings (e.g. to release memory)."""
+    with _generate_cache_lock:
+        _generate_cache.clear()
 
 
 def assemble_building(
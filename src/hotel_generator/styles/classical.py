@@ -2,21 +2,20 @@
 
 from __future__ import annotations
 
-import random
 from typing import Any
 
 from manifold3d import Manifold
 
 from hotel_generator.config import BuildingParams, PrinterProfile
 from hotel_generator.geometry.primitives import (
-    box,
+    box_at,
     extrude_polygon,
     BOOLEAN_EMBED,
     BOOLEAN_OVERSHOOT,
 )
 from hotel_generator.geometry.transforms import translate, rotate_x
 from hotel_generator.components.massing import rect_mass
-from hotel_generator.components.facade import window_grid_cutouts
+from hotel_generator.components.facade import window_stencil
 from hotel_generator.components.door import door_cutout
 from hotel_generator.components.column import square_column, round_column
 from hotel_generator.components.scale import ScaleContext
@@ -53,7 +52,6 @@ class ClassicalStyle(HotelStyle):
         )
 
     def generate(self, params: BuildingParams, profile: PrinterProfile) -> Manifold:
-        rng = random.Random(params.seed)
         w = params.width
         d = params.depth
         num_floors = max(params.num_floors, 5)
@@ -71,19 +69,18 @@ class ClassicalStyle(HotelStyle):
         win_h = sc.window_height
         wins_per_floor = sc.windows_per_floor(w)
 
+        stencil = window_stencil(
+            wall_width=w,
+            wall_height=total_h,
+            wall_thickness=wall_t,
+            num_floors=num_floors,
+            floor_height=fh,
+            windows_per_floor=wins_per_floor,
+            window_width=win_w,
+            window_height=win_h,
+        )
         for y_sign in [-1, 1]:
-            cuts = window_grid_cutouts(
-                wall_width=w,
-                wall_height=total_h,
-                wall_thickness=wall_t,
-                num_floors=num_floors,
-                floor_height=fh,
-                windows_per_floor=wins_per_floor,
-                window_width=win_w,
-                window_height=win_h,
-            )
-            for c in cuts:
-                cutouts.append(translate(c, y=y_sign * d / 2))
+            cutouts.append(translate(stencil, y=y_sign * d / 2))
 
         # Grand entrance door
         door_w = sc.door_width
@@ -104,8 +101,10 @@ class ClassicalStyle(HotelStyle):
         # Entablature (horizontal band at top of columns)
         ent_h = sc.entablature_height
         ent_overshoot = sc.roof_overhang
-        entablature = box(w + 2 * ent_overshoot, d + 2 * ent_overshoot, ent_h)
-        entablature = translate(entablature, z=total_h - BOOLEAN_EMBED)
+        entablature = box_at(
+            w + 2 * ent_overshoot, d + 2 * ent_overshoot, ent_h,
+            z=total_h - BOOLEAN_EMBED,
+        )
         additions.append(entablature)
 
         # Triangular pediment on front facade — extends over portico
@@ -135,14 +134,18 @@ class ClassicalStyle(HotelStyle):
         # Portico floor (slab connecting columns to building)
         portico_d = col_standoff + col_w / 2 + BOOLEAN_EMBED
         portico_slab_h = sc.cornice_height
-        portico = box(w * 0.9, portico_d, portico_slab_h)
-        portico = translate(portico, y=-d / 2 - portico_d / 2 + BOOLEAN_EMBED)
+        portico = box_at(
+            w * 0.9, portico_d, portico_slab_h,
+            y=-d / 2 - portico_d / 2 + BOOLEAN_EMBED,
+        )
         additions.append(portico)
 
         # Cornice (small overhang at top)
         cornice_h = sc.cornice_height
-        cornice = box(w + 2 * ent_overshoot, d + 2 * ent_overshoot, cornice_h)
-        cornice = translate(cornice, z=total_h + ent_h - BOOLEAN_EMBED - cornice_h * 0.3)
+        cornice = box_at(
+            w + 2 * ent_overshoot, d + 2 * ent_overshoot, cornice_h,
+            z=total_h + ent_h - BOOLEAN_EMBED - cornice_h * 0.3,
+        )
         additions.append(cornice)
 
         return assemble_building(shell, cutouts, additions)
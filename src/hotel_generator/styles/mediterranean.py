@@ -2,17 +2,16 @@
 
 from __future__ import annotations
 
-import random
 from typing import Any
 
 from manifold3d import Manifold
 
 from hotel_generator.config import BuildingParams, PrinterProfile
-from hotel_generator.geometry.primitives import box, BOOLEAN_EMBED, BOOLEAN_OVERSHOOT
+from hotel_generator.geometry.primitives import box_at, BOOLEAN_EMBED, BOOLEAN_OVERSHOOT
 from hotel_generator.geometry.transforms import translate
 from hotel_generator.components.massing import rect_mass
 from hotel_generator.components.roof import barrel_roof, hipped_roof
-from hotel_generator.components.facade import window_grid_cutouts
+from hotel_generator.components.facade import window_stencil
 from hotel_generator.components.door import door_cutout
 from hotel_generator.components.scale import ScaleContext
 from hotel_generator.styles.base import GardenTheme, HotelStyle, register_style, assemble_building
@@ -48,7 +47,6 @@ class MediterraneanStyle(HotelStyle):
         )
 
     def generate(self, params: BuildingParams, profile: PrinterProfile) -> Manifold:
-        rng = random.Random(params.seed)
         w = params.width
         d = params.depth
         num_floors = max(params.num_floors, 4)
@@ -65,19 +63,18 @@ class MediterraneanStyle(HotelStyle):
         win_h = sc.window_height
         wins_per_floor = sc.windows_per_floor(w)
 
+        stencil = window_stencil(
+            wall_width=w,
+            wall_height=total_h,
+            wall_thickness=wall_t,
+            num_floors=num_floors,
+            floor_height=fh,
+            windows_per_floor=wins_per_floor,
+            window_width=win_w,
+            window_height=win_h,
+        )
         for y_sign in [-1, 1]:
-            cuts = window_grid_cutouts(
-                wall_width=w,
-                wall_height=total_h,
-                wall_thickness=wall_t,
-                num_floors=num_floors,
-                floor_height=fh,
-                windows_per_floor=wins_per_floor,
-                window_width=win_w,
-                window_height=win_h,
-            )
-            for c in cuts:
-                cutouts.append(translate(c, y=y_sign * d / 2))
+            cutouts.append(translate(stencil, y=y_sign * d / 2))
 
         # Arched entrance
         door_w = sc.door_width
@@ -102,9 +99,8 @@ class MediterraneanStyle(HotelStyle):
         loggia_w = w * 0.5
         loggia_d = sc.loggia_depth
         loggia_h = sc.cornice_height
-        loggia = box(loggia_w, loggia_d, loggia_h)
-        loggia = translate(
-            loggia,
+        loggia = box_at(
+            loggia_w, loggia_d, loggia_h,
             y=-d / 2 - loggia_d / 2 + BOOLEAN_EMBED,
             z=fh - loggia_h,
         )
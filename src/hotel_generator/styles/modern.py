@@ -2,18 +2,17 @@
 
 from __future__ import annotations
 
-import random
-from typing import Any
+from typing import Any, ClassVar
 
 from manifold3d import Manifold
 
 from hotel_generator.config import BuildingParams, PrinterProfile
 from hotel_generator.errors import InvalidParamsError
 from hotel_generator.geometry.primitives import box, BOOLEAN_OVERSHOOT, BOOLEAN_EMBED
-from hotel_generator.geometry.transforms import translate
+from hotel_generator.geometry.transforms import rotate_z, translate
 from hotel_generator.components.massing import rect_mass
 from hotel_generator.components.roof import flat_roof
-from hotel_generator.components.facade import window_grid_cutouts
+from hotel_generator.components.facade import window_stencil
 from hotel_generator.components.door import door_cutout
 from hotel_generator.components.scale import ScaleContext
 from hotel_generator.styles.base import GardenTheme, HotelStyle, register_style, assemble_building
@@ -23,6 +22,13 @@ from hotel_generator.styles.base import GardenTheme, HotelStyle, register_style,
 class ModernStyle(HotelStyle):
     """Modern style: clean lines, flat roof, horizontal window bands."""
 
+    _DEFAULT_PARAMS: ClassVar[dict[str, Any]] = {
+        "has_penthouse": True,
+        "has_cantilever": False,
+        "window_style": "grid",
+    }
+    _WINDOW_STYLES: ClassVar[tuple[str, ...]] = ("grid", "band")
+
     @property
     def name(self) -> str:
         return "modern"
@@ -66,7 +72,7 @@ class ModernStyle(HotelStyle):
                 },
                 "window_style": {
                     "type": "string",
-                    "enum": ["grid", "band"],
+                    "enum": list(self._WINDOW_STYLES),
                     "default": "grid",
                     "description": "Window layout style",
                 },
@@ -74,13 +80,8 @@ class ModernStyle(HotelStyle):
         }
 
     def validate_style_params(self, params: dict[str, Any]) -> dict[str, Any]:
-        defaults = {
-            "has_penthouse": True,
-            "has_cantilever": False,
-            "window_style": "grid",
-        }
-        result = {**defaults, **params}
-        if result["window_style"] not in ("grid", "band"):
+        result = {**self._DEFAULT_PARAMS, **params}
+        if result["window_style"] not in self._WINDOW_STYLES:
             raise InvalidParamsError(
                 f"window_style must be 'grid' or 'band', got '{result['window_style']}'"
             )
@@ -91,7 +92,6 @@ class ModernStyle(HotelStyle):
         params: BuildingParams,
         profile: PrinterProfile,
     ) -> Manifold:
-        rng = random.Random(params.seed)
 
         style_p = self.validate_style_params(params.style_params)
         w = params.width
@@ -113,22 +113,8 @@ class ModernStyle(HotelStyle):
 
         cutouts = []
 
-        # Front facade windows (at -depth/2)
-        front_cuts = window_grid_cutouts(
-            wall_width=w,
-            wall_height=total_h,
-            wall_thickness=wall_t,
-            num_floors=num_floors,
-            floor_height=fh,
-            windows_per_floor=windows_per_floor,
-            window_width=win_w,
-            window_height=win_h,
-        )
-        for c in front_cuts:
-            cutouts.append(translate(c, y=-d / 2))
-
-        # Back facade windows (at +depth/2)
-        back_cuts = window_grid_cutouts(
+        # Front and back facade windows share one grid (at -/+ depth/2)
+        stencil = window_stencil(
             wall_width=w,
             wall_height=total_h,
             wall_thickness=wall_t,
@@ -138,13 +124,13 @@ class ModernStyle(HotelStyle):
             window_width=win_w,
             window_height=win_h,
         )
-        for c in back_cuts:
-            cutouts.append(translate(c, y=d / 2))
+        for y_sign in [-1, 1]:
+            cutouts.append(translate(stencil, y=y_sign * d / 2))
 
         # Side windows (fewer per floor)
         side_wins = sc.windows_per_floor(d)
-        for side_y_sign in [-1, 1]:
-            side_cuts = window_grid_cutouts(
+        stencil = rotate_z(
+            window_stencil(
                 wall_width=d,
                 wall_height=total_h,
                 wall_thickness=wall_t,
@@ -153,11 +139,11 @@ class ModernStyle(HotelStyle):
                 windows_per_floor=side_wins,
                 window_width=win_w,
                 window_height=win_h,
-            )
-            for c in side_cuts:
-                from hotel_generator.geometry.transforms import rotate_z
-                rotated = rotate_z(c, 90)
-                cutouts.append(translate(rotated, x=side_y_sign * w / 2))
+            ),
+            90,
+        )
+        for side_y_sign in [-1, 1]:
+            cutouts.append(translate(stencil, x=side_y_sign * w / 2))
 
         # Door cutout on front facade
         door_w = sc.door_width
@@ -2,17 +2,16 @@
 
 from __future__ import annotations
 
-import random
 from typing import Any
 
 from manifold3d import Manifold
 
 from hotel_generator.config import BuildingParams, PrinterProfile
 from hotel_generator.geometry.primitives import box, BOOLEAN_EMBED, BOOLEAN_OVERSHOOT
-from hotel_generator.geometry.transforms import translate
+from hotel_generator.geometry.transforms import rotate_z, translate
 from hotel_generator.components.massing import podium_tower_mass
 from hotel_generator.components.roof import flat_roof
-from hotel_generator.components.facade import window_grid_cutouts
+from hotel_generator.components.facade import window_stencil
 from hotel_generator.components.door import door_cutout
 from hotel_generator.components.scale import ScaleContext
 from hotel_generator.styles.base import GardenTheme, HotelStyle, register_style, assemble_building
@@ -48,7 +47,6 @@ class SkyscraperStyle(HotelStyle):
         )
 
     def generate(self, params: BuildingParams, profile: PrinterProfile) -> Manifold:
-        rng = random.Random(params.seed)
         w = params.width
         d = params.depth
         num_floors = max(params.num_floors, 12)  # Skyscrapers need real height
@@ -75,26 +73,24 @@ class SkyscraperStyle(HotelStyle):
         podium_wins = sc.windows_per_floor(w)
         podium_win_w = sc.window_width
         podium_win_h = sc.window_height
+        stencil = window_stencil(
+            wall_width=w,
+            wall_height=podium_h,
+            wall_thickness=wall_t,
+            num_floors=podium_floors,
+            floor_height=fh,
+            windows_per_floor=podium_wins,
+            window_width=podium_win_w,
+            window_height=podium_win_h,
+            ground_floor_skip=True,
+        )
         for y_sign in [-1, 1]:
-            cuts = window_grid_cutouts(
-                wall_width=w,
-                wall_height=podium_h,
-                wall_thickness=wall_t,
-                num_floors=podium_floors,
-                floor_height=fh,
-                windows_per_floor=podium_wins,
-                window_width=podium_win_w,
-                window_height=podium_win_h,
-                ground_floor_skip=True,
-            )
-            for c in cuts:
-                cutouts.append(translate(c, y=y_sign * d / 2))
+            cutouts.append(translate(stencil, y=y_sign * d / 2))
 
         # Podium side windows
-        from hotel_generator.geometry.transforms import rotate_z
         podium_side_wins = sc.windows_per_floor(d)
-        for x_sign in [-1, 1]:
-            cuts = window_grid_cutouts(
+        stencil = rotate_z(
+            window_stencil(
                 wall_width=d,
                 wall_height=podium_h,
                 wall_thickness=wall_t,
@@ -104,35 +100,35 @@ class SkyscraperStyle(HotelStyle):
                 window_width=podium_win_w,
                 window_height=podium_win_h,
                 ground_floor_skip=True,
-            )
-            for c in cuts:
-                rotated = rotate_z(c, 90)
-                cutouts.append(translate(rotated, x=x_sign * w / 2))
+            ),
+            90,
+        )
+        for x_sign in [-1, 1]:
+            cutouts.append(translate(stencil, x=x_sign * w / 2))
 
         # Tower windows (dense grid = curtain wall)
         tower_sc = ScaleContext(tower_w, tower_d, fh, tower_floors, profile)
         tower_wins = tower_sc.windows_per_floor(tower_w)
         tower_win_w = sc.window_width * 0.6  # narrow curtain wall strips
         tower_win_h = sc.window_height
+        stencil = window_stencil(
+            wall_width=tower_w,
+            wall_height=tower_h,
+            wall_thickness=wall_t,
+            num_floors=tower_floors,
+            floor_height=fh,
+            windows_per_floor=tower_wins,
+            window_width=tower_win_w,
+            window_height=tower_win_h,
+            ground_floor_skip=False,
+        )
         for y_sign in [-1, 1]:
-            cuts = window_grid_cutouts(
-                wall_width=tower_w,
-                wall_height=tower_h,
-                wall_thickness=wall_t,
-                num_floors=tower_floors,
-                floor_height=fh,
-                windows_per_floor=tower_wins,
-                window_width=tower_win_w,
-                window_height=tower_win_h,
-                ground_floor_skip=False,
-            )
-            for c in cuts:
-                cutouts.append(translate(c, y=y_sign * tower_d / 2, z=podium_h))
+            cutouts.append(translate(stencil, y=y_sign * tower_d / 2, z=podium_h))
 
         # Side tower windows
         tower_side_wins = tower_sc.windows_per_floor(tower_d)
-        for x_sign in [-1, 1]:
-            cuts = window_grid_cutouts(
+        stencil = rotate_z(
+            window_stencil(
                 wall_width=tower_d,
                 wall_height=tower_h,
                 wall_thickness=wall_t,
@@ -142,10 +138,11 @@ class SkyscraperStyle(HotelStyle):
                 window_width=tower_win_w,
                 window_height=tower_win_h,
                 ground_floor_skip=False,
-            )
-            for c in cuts:
-                rotated = rotate_z(c, 90)
-                cutouts.append(translate(rotated, x=x_sign * tower_w / 2, z=podium_h))
+            ),
+            90,
+        )
+        for x_sign in [-1, 1]:
+            cutouts.append(translate(stencil, x=x_sign * tower_w / 2, z=podium_h))
 
         # Door on podium
         door_w = sc.door_width
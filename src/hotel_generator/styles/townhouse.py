@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import random
 from typing import Any
 
 from manifold3d import Manifold
@@ -12,7 +11,7 @@ from hotel_generator.geometry.primitives import box, BOOLEAN_EMBED, BOOLEAN_OVER
 from hotel_generator.geometry.transforms import translate
 from hotel_generator.components.massing import rect_mass
 from hotel_generator.components.roof import mansard_roof
-from hotel_generator.components.facade import window_grid_cutouts
+from hotel_generator.components.facade import window_stencil
 from hotel_generator.components.door import door_cutout
 from hotel_generator.components.scale import ScaleContext
 from hotel_generator.styles.base import GardenTheme, HotelStyle, register_style, assemble_building
@@ -48,7 +47,6 @@ class TownhouseStyle(HotelStyle):
         )
 
     def generate(self, params: BuildingParams, profile: PrinterProfile) -> Manifold:
-        rng = random.Random(params.seed)
         w = params.width
         d = params.depth
         num_floors = max(params.num_floors, 5)
@@ -66,19 +64,18 @@ class TownhouseStyle(HotelStyle):
         wins_per_floor = sc.windows_per_floor(w)
 
         # Front and back windows
+        stencil = window_stencil(
+            wall_width=w,
+            wall_height=total_h,
+            wall_thickness=wall_t,
+            num_floors=num_floors,
+            floor_height=fh,
+            windows_per_floor=wins_per_floor,
+            window_width=win_w,
+            window_height=win_h,
+        )
         for y_sign in [-1, 1]:
-            cuts = window_grid_cutouts(
-                wall_width=w,
-                wall_height=total_h,
-                wall_thickness=wall_t,
-                num_floors=num_floors,
-                floor_height=fh,
-                windows_per_floor=wins_per_floor,
-                window_width=win_w,
-                window_height=win_h,
-            )
-            for c in cuts:
-                cutouts.append(translate(c, y=y_sign * d / 2))
+            cutouts.append(translate(stencil, y=y_sign * d / 2))
 
         # Door
         door_w = sc.door_width
@@ -100,15 +97,15 @@ class TownhouseStyle(HotelStyle):
         step_h = sc.stoop_step_height
         step_d = sc.stoop_step_depth
         stoop_w = door_w + sc.column_width * 2
+        step = box(stoop_w, step_d, step_h)
         for i in range(num_steps):
-            step = box(stoop_w, step_d, step_h)
-            step = translate(
+            placed = translate(
                 step,
                 x=-w / 4,
                 y=-d / 2 - step_d * (i + 0.5) + BOOLEAN_EMBED,
                 z=-step_h * i,
             )
-            additions.append(step)
+            additions.append(placed)
 
         # Bay window (protruding box on front facade, upper floors)
         bay_w = w * 0.35
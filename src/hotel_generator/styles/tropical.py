@@ -2,21 +2,20 @@
 
 from __future__ import annotations
 
-import random
 from typing import Any
 
 from manifold3d import Manifold
 
 from hotel_generator.config import BuildingParams, PrinterProfile
-from hotel_generator.geometry.primitives import box, BOOLEAN_EMBED, BOOLEAN_OVERSHOOT
-from hotel_generator.geometry.transforms import translate
+from hotel_generator.geometry.primitives import box, extrude_polygon, BOOLEAN_EMBED, BOOLEAN_OVERSHOOT
+from hotel_generator.geometry.transforms import translate, translate_instances
 from hotel_generator.components.massing import rect_mass
 from hotel_generator.components.roof import hipped_roof, pagoda_roof
-from hotel_generator.components.facade import window_grid_cutouts
+from hotel_generator.components.facade import window_stencil
 from hotel_generator.components.column import square_column
 from hotel_generator.components.scale import ScaleContext
 from hotel_generator.styles.base import GardenTheme, HotelStyle, register_style, assemble_building
-from hotel_generator.geometry.booleans import union_all
+from hotel_generator.geometry.booleans import compose_disjoint, union_all
 
 
 @register_style
@@ -49,7 +48,6 @@ class TropicalStyle(HotelStyle):
         )
 
     def generate(self, params: BuildingParams, profile: PrinterProfile) -> Manifold:
-        rng = random.Random(params.seed)
         w = params.width
         d = params.depth
         num_floors = max(params.num_floors, 5)
@@ -72,20 +70,19 @@ class TropicalStyle(HotelStyle):
         win_h = sc.window_height
         wins_per_floor = sc.windows_per_floor(w)
 
+        stencil = window_stencil(
+            wall_width=w,
+            wall_height=building_h,
+            wall_thickness=wall_t,
+            num_floors=building_floors,
+            floor_height=fh,
+            windows_per_floor=wins_per_floor,
+            window_width=win_w,
+            window_height=win_h,
+            ground_floor_skip=False,
+        )
         for y_sign in [-1, 1]:
-            cuts = window_grid_cutouts(
-                wall_width=w,
-                wall_height=building_h,
-                wall_thickness=wall_t,
-                num_floors=building_floors,
-                floor_height=fh,
-                windows_per_floor=wins_per_floor,
-                window_width=win_w,
-                window_height=win_h,
-                ground_floor_skip=False,
-            )
-            for c in cuts:
-                cutouts.append(translate(c, y=y_sign * d / 2, z=stilt_h))
+            cutouts.append(translate(stencil, y=y_sign * d / 2, z=stilt_h))
 
         # Additions
         additions = []
@@ -101,10 +98,14 @@ class TropicalStyle(HotelStyle):
             (0, -d / 2 + col_w),
             (0, d / 2 - col_w),
         ]
-        for x, y in stilt_positions:
-            col = square_column(col_w, stilt_h + BOOLEAN_EMBED)
-            col = translate(col, x=x, y=y)
-            additions.append(col)
+        col = square_column(col_w, stilt_h + BOOLEAN_EMBED)
+        stilts = translate_instances(col, [(x, y, 0) for x, y in stilt_positions])
+        # Stilts only stay apart when the corner-to-midpoint gap (w/2 - 2*col_w)
+        # and the front-to-back gap are positive; compose needs disjoint solids
+        if w > 4 * col_w and d > 3 * col_w:
+            additions.append(compose_disjoint(stilts))
+        else:
+            additions.extend(stilts)
 
         # Pagoda-style multi-tier roof — distinctive Japanese/East Asian silhouette
         overhang = sc.eave_overhang * 1.5
@@ -120,7 +121,6 @@ class TropicalStyle(HotelStyle):
         additions.append(roof)
 
         # Overhang support brackets (45-degree, under the eaves)
-        from hotel_generator.geometry.primitives import extrude_polygon
         bracket_size = overhang * 0.7
         bracket_thickness = sc.fin_thickness
         bracket_profile = [
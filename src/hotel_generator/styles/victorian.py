@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import random
 from typing import Any
 
 from manifold3d import Manifold
@@ -15,11 +14,11 @@ from hotel_generator.geometry.primitives import (
     BOOLEAN_EMBED,
     BOOLEAN_OVERSHOOT,
 )
-from hotel_generator.geometry.transforms import translate
+from hotel_generator.geometry.transforms import rotate_z, translate
 from hotel_generator.geometry.booleans import union_all
 from hotel_generator.components.massing import l_shape_mass
 from hotel_generator.components.roof import gabled_roof, hipped_roof, onion_dome
-from hotel_generator.components.facade import window_grid_cutouts
+from hotel_generator.components.facade import window_stencil
 from hotel_generator.components.door import door_cutout
 from hotel_generator.components.scale import ScaleContext
 from hotel_generator.styles.base import GardenTheme, HotelStyle, register_style, assemble_building
@@ -55,7 +54,6 @@ class VictorianStyle(HotelStyle):
         )
 
     def generate(self, params: BuildingParams, profile: PrinterProfile) -> Manifold:
-        rng = random.Random(params.seed)
         w = params.width
         d = params.depth
         num_floors = max(params.num_floors, 5)
@@ -76,19 +74,18 @@ class VictorianStyle(HotelStyle):
         wins_per_floor = sc.windows_per_floor(w)
 
         # Main block windows (front/back)
+        stencil = window_stencil(
+            wall_width=w,
+            wall_height=total_h,
+            wall_thickness=wall_t,
+            num_floors=num_floors,
+            floor_height=fh,
+            windows_per_floor=wins_per_floor,
+            window_width=win_w,
+            window_height=win_h,
+        )
         for y_sign in [-1, 1]:
-            cuts = window_grid_cutouts(
-                wall_width=w,
-                wall_height=total_h,
-                wall_thickness=wall_t,
-                num_floors=num_floors,
-                floor_height=fh,
-                windows_per_floor=wins_per_floor,
-                window_width=win_w,
-                window_height=win_h,
-            )
-            for c in cuts:
-                cutouts.append(translate(c, y=y_sign * d / 2))
+            cutouts.append(translate(stencil, y=y_sign * d / 2))
 
         # Door
         door_w = sc.door_width
@@ -122,7 +119,6 @@ class VictorianStyle(HotelStyle):
         additions.append(roof)
 
         # Wing gabled roof (perpendicular)
-        from hotel_generator.geometry.transforms import rotate_z
         wing_roof = gabled_roof(wing_d + 2 * ovh, wing_w + 2 * ovh, fh * 0.7)
         wing_roof = rotate_z(wing_roof, 90)
         wing_roof = translate(
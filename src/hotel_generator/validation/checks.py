@@ -1,57 +1,63 @@
 """Validation checks for generated hotel geometry."""
 
 import numpy as np
-import trimesh
-from manifold3d import Manifold
-
-from hotel_generator.export.stl import manifold_to_trimesh
+from manifold3d import Error, Manifold
 
 
 def validate_manifold(solid: Manifold) -> dict:
     """Run validation checklist on a generated manifold.
 
     Returns a dict with check results and overall pass/fail.
+
+    Volume, bounds and triangle count come straight from the Manifold;
+    only the degenerate-triangle check reads the mesh arrays.
     """
     results = {}
     warnings = []
 
-    # Convert to trimesh for checks
-    tmesh = manifold_to_trimesh(solid)
-
-    # 1. Watertight
-    results["is_watertight"] = tmesh.is_watertight
+    # 1. Watertight: a non-empty Manifold with no error status is closed
+    # and 2-manifold by construction
+    results["is_watertight"] = (
+        not solid.is_empty() and solid.status() == Error.NoError
+    )
 
     # 2. Positive volume
-    vol = tmesh.volume
+    vol = solid.volume()
     results["volume"] = float(vol)
     results["positive_volume"] = vol > 0
 
     # 3. Correct orientation (base at Z=0)
-    bbox = tmesh.bounds  # [[min_x, min_y, min_z], [max_x, max_y, max_z]]
-    results["base_at_z0"] = bbox[0][2] >= -2.0  # allow for base slab
+    bbox = np.array(solid.bounding_box()).reshape(2, 3)  # [min_xyz, max_xyz]
+    results["base_at_z0"] = bool(bbox[0][2] >= -2.0)  # allow for base slab
 
     # 4. Reasonable size (fits within 120mm x 120mm x 120mm)
     size = bbox[1] - bbox[0]
-    results["reasonable_size"] = (
-        size[0] <= 120 and size[1] <= 120 and size[2] <= 120
-    )
+    results["reasonable_size"] = bool((size <= 120).all())
 
     # 5. Not too small (exceeds 5mm in at least 2 dimensions)
-    large_dims = sum(1 for s in size if s >= 5)
-    results["not_too_small"] = large_dims >= 2
+    results["not_too_small"] = int((size >= 5).sum()) >= 2
 
     # 6. Triangle count
-    tri_count = len(tmesh.faces)
+    tri_count = solid.num_tri()
     results["triangle_count"] = tri_count
     results["triangle_count_ok"] = 4 <= tri_count <= 200_000
 
-    # 7. No degenerate triangles
-    areas = tmesh.area_faces
-    results["no_degenerate_triangles"] = bool(np.all(areas > 1e-10))
+    # 7. No degenerate triangles (area > 1e-10). |cross| = 2 * area, so
+    # compare squared norms and skip the sqrt. Use float64 like the STL
+    # export does.
+    if tri_count:
+        mesh = solid.to_mesh()
+        tri = np.asarray(mesh.vert_properties[:, :3], dtype=np.float64)[mesh.tri_verts]
+        cross = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        results["no_degenerate_triangles"] = bool(
+            np.einsum("ij,ij->i", cross, cross).min() > (2 * 1e-10) ** 2
+        )
+    else:
+        results["no_degenerate_triangles"] = True
 
     # 8. Single connected component (approximately)
-    # trimesh split can be expensive; just check it's not empty
-    results["single_component"] = len(tmesh.faces) > 0
+    # splitting into components can be expensive; just check it's not empty
+    results["single_component"] = tri_count > 0
 
     # Overall pass
     critical_checks = [
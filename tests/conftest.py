@@ -3,6 +3,13 @@
 import pytest
 
 from hotel_generator.settings import Settings
+from hotel_generator.styles.base import clear_generate_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_generate_cache():
+    """Start every test with an empty building cache."""
+    clear_generate_cache()
 
 
 @pytest.fixture
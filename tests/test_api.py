@@ -1,6 +1,7 @@
 """Tests for the FastAPI application."""
 
 import json
+import os
 
 import pytest
 from fastapi.testclient import TestClient
@@ -8,11 +9,20 @@ from fastapi.testclient import TestClient
 from hotel_generator.api import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
     return TestClient(app)
 
 
+@pytest.fixture(scope="module")
+def complex_response(client):
+    """One default two-building /complex/generate response, shared by read-only tests."""
+    return client.post("/complex/generate", json={
+        "style_name": "modern",
+        "num_buildings": 2,
+    })
+
+
 class TestHealthEndpoint:
     def test_health(self, client):
         r = client.get("/health")
@@ -84,7 +94,6 @@ class TestPreviewPNGEndpoint:
     def _can_render(self):
         """Check if headless rendering is available."""
         try:
-            import os
             os.environ.setdefault("PYOPENGL_PLATFORM", "osmesa")
             import pyrender
             r = pyrender.OffscreenRenderer(32, 32)
@@ -143,20 +152,14 @@ class TestPresetsEndpoint:
 
 
 class TestComplexGenerateEndpoint:
-    def test_complex_generate_returns_glb(self, client):
-        r = client.post("/complex/generate", json={
-            "style_name": "modern",
-            "num_buildings": 2,
-        })
+    def test_complex_generate_returns_glb(self, complex_response):
+        r = complex_response
         assert r.status_code == 200
         assert r.headers["content-type"] == "application/octet-stream"
         assert len(r.content) > 0
 
-    def test_complex_generate_has_metadata(self, client):
-        r = client.post("/complex/generate", json={
-            "style_name": "modern",
-            "num_buildings": 2,
-        })
+    def test_complex_generate_has_metadata(self, complex_response):
+        r = complex_response
         assert "X-Complex-Metadata" in r.headers
         metadata = json.loads(r.headers["X-Complex-Metadata"])
         assert metadata["num_buildings"] == 2
@@ -197,7 +200,6 @@ class TestComplexExportEndpoint:
         assert len(data["files"]) == 4
 
     def test_complex_export_creates_files(self, client):
-        import os
         r = client.post("/complex/export", json={
             "style_name": "modern",
             "num_buildings": 2,
@@ -2,17 +2,23 @@
 
 import pytest
 
-from hotel_generator.assembly.building import HotelBuilder, BuildResult
+from hotel_generator.assembly.building import HotelBuilder, BuildResult, generate_batch
 from hotel_generator.config import BuildingParams
 from hotel_generator.errors import InvalidParamsError
 from hotel_generator.settings import Settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def builder():
     return HotelBuilder(Settings())
 
 
+@pytest.fixture(scope="module")
+def modern_result(builder):
+    """Default modern build, shared by read-only assertions."""
+    return builder.build(BuildingParams(style_name="modern"))
+
+
 class TestHotelBuilder:
     def test_build_returns_build_result(self, builder):
         params = BuildingParams(
@@ -26,9 +32,8 @@ class TestHotelBuilder:
         result = builder.build(params)
         assert isinstance(result, BuildResult)
 
-    def test_build_result_fields(self, builder):
-        params = BuildingParams(style_name="modern")
-        result = builder.build(params)
+    def test_build_result_fields(self, modern_result):
+        result = modern_result
         assert result.is_watertight
         assert result.triangle_count > 0
         assert not result.manifold.is_empty()
@@ -36,9 +41,8 @@ class TestHotelBuilder:
         assert "style" in result.metadata
         assert result.metadata["style"] == "modern"
 
-    def test_build_with_base(self, builder):
-        params = BuildingParams(style_name="modern")
-        result = builder.build(params)
+    def test_build_with_base(self, modern_result):
+        result = modern_result
         # Base extends below z=0
         min_x, min_y, min_z, max_x, max_y, max_z = result.bounding_box
         assert min_z < 0  # base slab is below building
@@ -48,9 +52,8 @@ class TestHotelBuilder:
         with pytest.raises(InvalidParamsError, match="Unknown style"):
             builder.build(params)
 
-    def test_metadata_includes_timing(self, builder):
-        params = BuildingParams(style_name="modern")
-        result = builder.build(params)
+    def test_metadata_includes_timing(self, modern_result):
+        result = modern_result
         assert "generation_time_ms" in result.metadata
         assert result.metadata["generation_time_ms"] >= 0
 
@@ -60,6 +63,23 @@ class TestHotelBuilder:
             result = builder.build(params)
             assert result.is_watertight
 
+    def test_generate_cache_off_by_default(self, builder):
+        params = BuildingParams(style_name="modern", num_floors=3)
+        r1 = builder.build(params)
+        r2 = builder.build(params)
+        assert r1.metadata["cache_hit"] is False
+        assert r2.metadata["cache_hit"] is False
+        assert r2.manifold is not r1.manifold
+
+    def test_generate_cache_opt_in(self):
+        cached_builder = HotelBuilder(Settings(generate_cache=True))
+        params = BuildingParams(style_name="modern", num_floors=3)
+        r1 = cached_builder.build(params, skip_base=True)
+        r2 = cached_builder.build(params, skip_base=True)
+        assert r1.metadata["cache_hit"] is False
+        assert r2.metadata["cache_hit"] is True
+        assert r2.manifold is r1.manifold
+
     def test_different_seeds_same_structure(self, builder):
         p1 = BuildingParams(style_name="modern", seed=1)
         p2 = BuildingParams(style_name="modern", seed=2)
@@ -68,3 +88,31 @@ class TestHotelBuilder:
         # Both should be valid
         assert r1.is_watertight
         assert r2.is_watertight
+
+
+class TestGenerateBatch:
+    def test_batch_matches_sequential_builds(self, builder):
+        jobs = [
+            BuildingParams(style_name="modern", num_floors=3, seed=1),
+            BuildingParams(style_name="classical", num_floors=3, seed=2),
+        ]
+        results = generate_batch(jobs, Settings(), max_workers=2)
+        assert len(results) == 2
+        for params, m in zip(jobs, results):
+            expected = builder.build(params).manifold
+            assert m.num_tri() == expected.num_tri()
+            assert m.volume() == pytest.approx(expected.volume(), rel=1e-4)
+
+    def test_batch_after_parent_build(self, modern_result):
+        # modern_result has already run manifold3d in this process; the
+        # workers must still start and finish
+        jobs = [
+            BuildingParams(style_name="modern", num_floors=3, seed=s)
+            for s in (3, 4)
+        ]
+        results = generate_batch(jobs, Settings(), max_workers=2)
+        assert len(results) == 2
+        assert all(not m.is_empty() for m in results)
+
+    def test_empty_batch(self):
+        assert generate_batch([], Settings()) == []
@@ -11,11 +11,28 @@ from hotel_generator.board.config import (
     PropertySlot,
 )
 from hotel_generator.board.garden_layout import GardenLayoutEngine, Rect
+from hotel_generator.board.property_builder import PropertyBuilder
 from hotel_generator.board.road import generate_road_layout
 from hotel_generator.config import BuildingPlacement
+from hotel_generator.settings import Settings
 from hotel_generator.styles.base import GardenTheme
 
 
+@pytest.fixture(scope="module")
+def property_builder():
+    return PropertyBuilder(Settings())
+
+
+@pytest.fixture(scope="module")
+def garden_engine():
+    return GardenLayoutEngine()
+
+
+@pytest.fixture
+def main_placements():
+    return [BuildingPlacement(x=0, y=40.0, width=30.0, depth=25.0, role="main")]
+
+
 # ---------------------------------------------------------------------------
 # Config validation
 # ---------------------------------------------------------------------------
@@ -102,8 +119,7 @@ class TestRoadLayout:
 # ---------------------------------------------------------------------------
 
 class TestGardenLayout:
-    def test_basic_layout(self):
-        engine = GardenLayoutEngine()
+    def test_basic_layout(self, garden_engine, main_placements):
         theme = GardenTheme(
             tree_type="deciduous",
             tree_density=0.5,
@@ -114,16 +130,13 @@ class TestGardenLayout:
             has_terrace=True,
             path_style="straight",
         )
-        placements = [
-            BuildingPlacement(x=0, y=40.0, width=30.0, depth=25.0, role="main"),
-        ]
         rng = random.Random(42)
-        features = engine.compute_layout(
+        features = garden_engine.compute_layout(
             lot_width=100.0,
             lot_depth=80.0,
             road_edge="south",
             road_width=8.0,
-            building_placements=placements,
+            building_placements=main_placements,
             garden_theme=theme,
             rng=rng,
         )
@@ -132,24 +145,19 @@ class TestGardenLayout:
         # Should have at least some of the expected feature types
         assert len(types) >= 2  # at least trees + something else
 
-    def test_no_pool_theme(self):
-        engine = GardenLayoutEngine()
+    def test_no_pool_theme(self, garden_engine, main_placements):
         theme = GardenTheme(pool_shape=None, has_hedges=False, has_terrace=False)
-        placements = [
-            BuildingPlacement(x=0, y=40.0, width=30.0, depth=25.0, role="main"),
-        ]
         rng = random.Random(42)
-        features = engine.compute_layout(
+        features = garden_engine.compute_layout(
             lot_width=100.0, lot_depth=80.0,
             road_edge="south", road_width=8.0,
-            building_placements=placements,
+            building_placements=main_placements,
             garden_theme=theme, rng=rng,
         )
         pool_features = [f for f in features if f.feature_type == "pool"]
         assert len(pool_features) == 0
 
-    def test_tropical_dense_trees(self):
-        engine = GardenLayoutEngine()
+    def test_tropical_dense_trees(self, garden_engine):
         theme = GardenTheme(
             tree_type="palm", tree_density=0.8,
             pool_shape="kidney", pool_size="large",
@@ -159,7 +167,7 @@ class TestGardenLayout:
             BuildingPlacement(x=0, y=40.0, width=20.0, depth=15.0, role="main"),
         ]
         rng = random.Random(42)
-        features = engine.compute_layout(
+        features = garden_engine.compute_layout(
             lot_width=100.0, lot_depth=80.0,
             road_edge="south", road_width=8.0,
             building_placements=placements,
@@ -168,12 +176,14 @@ class TestGardenLayout:
         tree_features = [f for f in features if "tree" in f.feature_type]
         assert len(tree_features) >= 3  # dense = more trees
 
-    def test_reproducible(self):
-        engine = GardenLayoutEngine()
+    def test_reproducible(self, garden_engine, main_placements):
         theme = GardenTheme()
-        placements = [BuildingPlacement(x=0, y=40.0, width=30.0, depth=25.0)]
-        f1 = engine.compute_layout(100.0, 80.0, "south", 8.0, placements, theme, random.Random(42))
-        f2 = engine.compute_layout(100.0, 80.0, "south", 8.0, placements, theme, random.Random(42))
+        f1 = garden_engine.compute_layout(
+            100.0, 80.0, "south", 8.0, main_placements, theme, random.Random(42)
+        )
+        f2 = garden_engine.compute_layout(
+            100.0, 80.0, "south", 8.0, main_placements, theme, random.Random(42)
+        )
         assert len(f1) == len(f2)
         for a, b in zip(f1, f2):
             assert a.feature_type == b.feature_type
@@ -196,12 +206,7 @@ class TestRect:
 class TestPropertyBuilder:
     """Integration tests — these generate actual geometry."""
 
-    def test_build_modern_property(self):
-        from hotel_generator.board.property_builder import PropertyBuilder
-        from hotel_generator.settings import Settings
-
-        settings = Settings()
-        builder = PropertyBuilder(settings)
+    def test_build_modern_property(self, property_builder):
         params = PropertyParams(
             style_name="modern",
             num_buildings=2,
@@ -209,19 +214,14 @@ class TestPropertyBuilder:
             lot_depth=80.0,
             seed=42,
         )
-        result = builder.build(params)
+        result = property_builder.build(params)
         assert not result.plate.is_empty()
         assert result.plate.volume() > 0
         assert len(result.buildings) == 2
         assert result.lot_width == 100.0
         assert result.lot_depth == 80.0
 
-    def test_build_tropical_with_garden(self):
-        from hotel_generator.board.property_builder import PropertyBuilder
-        from hotel_generator.settings import Settings
-
-        settings = Settings()
-        builder = PropertyBuilder(settings)
+    def test_build_tropical_with_garden(self, property_builder):
         params = PropertyParams(
             style_name="tropical",
             num_buildings=3,
@@ -230,38 +230,28 @@ class TestPropertyBuilder:
             garden_enabled=True,
             seed=99,
         )
-        result = builder.build(params)
+        result = property_builder.build(params)
         assert not result.plate.is_empty()
         assert len(result.garden_placements) > 0
 
-    def test_build_without_garden(self):
-        from hotel_generator.board.property_builder import PropertyBuilder
-        from hotel_generator.settings import Settings
-
-        settings = Settings()
-        builder = PropertyBuilder(settings)
+    def test_build_without_garden(self, property_builder):
         params = PropertyParams(
             style_name="modern",
             num_buildings=2,
             garden_enabled=False,
             seed=42,
         )
-        result = builder.build(params)
+        result = property_builder.build(params)
         assert not result.plate.is_empty()
         assert len(result.garden_placements) == 0
 
-    def test_build_with_preset(self):
-        from hotel_generator.board.property_builder import PropertyBuilder
-        from hotel_generator.settings import Settings
-
-        settings = Settings()
-        builder = PropertyBuilder(settings)
+    def test_build_with_preset(self, property_builder):
         params = PropertyParams(
             preset="royal",
             lot_width=100.0,
             lot_depth=80.0,
             seed=42,
         )
-        result = builder.build(params)
+        result = property_builder.build(params)
         assert not result.plate.is_empty()
         assert result.metadata["preset"] == "royal"
@@ -2,6 +2,7 @@
 
 import pytest
 
+from hotel_generator.assembly.building import HotelBuilder
 from hotel_generator.complex.builder import ComplexBuilder, ComplexResult
 from hotel_generator.complex.base_plate import complex_base_plate
 from hotel_generator.config import BuildingParams, BuildingPlacement, ComplexParams
@@ -9,11 +10,28 @@ from hotel_generator.errors import InvalidParamsError
 from hotel_generator.settings import Settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def builder():
     return ComplexBuilder(Settings())
 
 
+@pytest.fixture(scope="module")
+def hotel_builder():
+    return HotelBuilder(Settings())
+
+
+@pytest.fixture(scope="module")
+def modern2_result(builder):
+    """Default two-building modern complex, shared by read-only tests."""
+    return builder.build(ComplexParams(style_name="modern", num_buildings=2))
+
+
+@pytest.fixture(scope="module")
+def modern3_result(builder):
+    """Default three-building modern complex, shared by read-only tests."""
+    return builder.build(ComplexParams(style_name="modern", num_buildings=3))
+
+
 class TestBasePlate:
     def test_basic_plate(self):
         plate = complex_base_plate(80, 60, 2.5, 0.5)
@@ -37,31 +55,27 @@ class TestBasePlate:
 
 
 class TestComplexBuilder:
-    def test_build_returns_complex_result(self, builder):
-        params = ComplexParams(style_name="modern", num_buildings=2)
-        result = builder.build(params)
+    def test_build_returns_complex_result(self, modern2_result):
+        result = modern2_result
         assert isinstance(result, ComplexResult)
 
-    def test_correct_building_count(self, builder):
-        for n in [1, 2, 3]:
-            params = ComplexParams(style_name="modern", num_buildings=n)
-            result = builder.build(params)
-            assert len(result.buildings) == n
-
-    def test_each_building_watertight(self, builder):
-        params = ComplexParams(style_name="modern", num_buildings=3)
+    @pytest.mark.parametrize("n", [1, 2, 3])
+    def test_correct_building_count(self, builder, n):
+        params = ComplexParams(style_name="modern", num_buildings=n)
         result = builder.build(params)
+        assert len(result.buildings) == n
+
+    def test_each_building_watertight(self, modern3_result):
+        result = modern3_result
         for b in result.buildings:
             assert b.is_watertight
 
-    def test_base_plate_not_empty(self, builder):
-        params = ComplexParams(style_name="modern", num_buildings=2)
-        result = builder.build(params)
+    def test_base_plate_not_empty(self, modern2_result):
+        result = modern2_result
         assert not result.base_plate.is_empty()
 
-    def test_combined_not_empty(self, builder):
-        params = ComplexParams(style_name="modern", num_buildings=2)
-        result = builder.build(params)
+    def test_combined_not_empty(self, modern2_result):
+        result = modern2_result
         assert not result.combined.is_empty()
         assert result.combined.volume() > 0
 
@@ -83,39 +97,32 @@ class TestComplexBuilder:
         with pytest.raises(InvalidParamsError, match="Unknown style"):
             builder.build(params)
 
-    def test_metadata(self, builder):
-        params = ComplexParams(style_name="modern", num_buildings=3)
-        result = builder.build(params)
+    def test_metadata(self, modern3_result):
+        result = modern3_result
         assert result.metadata["style"] == "modern"
         assert result.metadata["num_buildings"] == 3
         assert "generation_time_ms" in result.metadata
 
-    def test_lot_dimensions(self, builder):
-        params = ComplexParams(style_name="modern", num_buildings=2)
-        result = builder.build(params)
+    def test_lot_dimensions(self, modern2_result):
+        result = modern2_result
         assert result.lot_width > 0
         assert result.lot_depth > 0
 
-    def test_placements_returned(self, builder):
-        params = ComplexParams(style_name="modern", num_buildings=3)
-        result = builder.build(params)
+    def test_placements_returned(self, modern3_result):
+        result = modern3_result
         assert len(result.placements) == 3
 
 
 class TestSkipBase:
-    def test_skip_base_no_base_slab(self):
-        from hotel_generator.assembly.building import HotelBuilder
-        builder = HotelBuilder(Settings())
+    def test_skip_base_no_base_slab(self, hotel_builder):
         params = BuildingParams(style_name="modern")
-        result = builder.build(params, skip_base=True)
+        result = hotel_builder.build(params, skip_base=True)
         # Without base, min_z should be >= 0 (no negative z)
         min_x, min_y, min_z, max_x, max_y, max_z = result.bounding_box
         assert min_z >= -0.2  # small tolerance for boolean embeds
 
-    def test_with_base_has_negative_z(self):
-        from hotel_generator.assembly.building import HotelBuilder
-        builder = HotelBuilder(Settings())
+    def test_with_base_has_negative_z(self, hotel_builder):
         params = BuildingParams(style_name="modern")
-        result = builder.build(params, skip_base=False)
+        result = hotel_builder.build(params, skip_base=False)
         min_x, min_y, min_z, max_x, max_y, max_z = result.bounding_box
         assert min_z < 0
@@ -1,7 +1,7 @@
 """Tests for building components."""
 
 import pytest
-from manifold3d import Manifold
+from manifold3d import Error, Manifold
 
 from hotel_generator.components.base import base_slab
 from hotel_generator.components.massing import (
@@ -25,7 +25,9 @@ from hotel_generator.components.roof import (
 from hotel_generator.components.column import round_column, square_column, pilaster
 from hotel_generator.components.floor_slab import floor_slab
 from hotel_generator.components.balcony import balcony
-from hotel_generator.components.facade import window_grid_cutouts
+from hotel_generator.components.facade import window_grid_cutouts, window_stencil
+from hotel_generator.geometry.booleans import union_all
+from hotel_generator.geometry.primitives import BOOLEAN_OVERSHOOT
 
 
 class TestBaseSlab:
@@ -80,17 +82,18 @@ class TestMassing:
         min_x, min_y, min_z, max_x, max_y, max_z = m.bounding_box()
         assert max_z > 0
 
-    def test_all_massing_base_at_z0(self):
-        for m in [
-            rect_mass(5, 4, 10),
-            l_shape_mass(5, 4, 10),
-            u_shape_mass(5, 4, 10),
-            t_shape_mass(5, 4, 10),
-            podium_tower_mass(5, 4, 3, 3, 3, 7),
-            stepped_mass(5, 4, 3, 3.0),
-        ]:
-            min_x, min_y, min_z, max_x, max_y, max_z = m.bounding_box()
-            assert abs(min_z) < 0.01, "Massing base should be at Z=0"
+    @pytest.mark.parametrize("mass_fn, args", [
+        (rect_mass, (5, 4, 10)),
+        (l_shape_mass, (5, 4, 10)),
+        (u_shape_mass, (5, 4, 10)),
+        (t_shape_mass, (5, 4, 10)),
+        (podium_tower_mass, (5, 4, 3, 3, 3, 7)),
+        (stepped_mass, (5, 4, 3, 3.0)),
+    ])
+    def test_all_massing_base_at_z0(self, mass_fn, args):
+        m = mass_fn(*args)
+        min_x, min_y, min_z, max_x, max_y, max_z = m.bounding_box()
+        assert abs(min_z) < 0.01, "Massing base should be at Z=0"
 
 
 class TestWall:
@@ -109,7 +112,6 @@ class TestWindow:
         assert w.volume() > 0
 
     def test_window_cutout_overshoots(self):
-        from hotel_generator.geometry.primitives import BOOLEAN_OVERSHOOT
         w = window_cutout(0.5, 0.7, 0.8)
         min_x, min_y, min_z, max_x, max_y, max_z = w.bounding_box()
         expected_depth = 0.8 + 2 * BOOLEAN_OVERSHOOT
@@ -230,3 +232,50 @@ class TestFacade:
             ground_floor_skip=False,
         )
         assert len(cuts) == 12  # 4 floors × 3 windows
+
+    def test_window_stencil_matches_grid(self):
+        kwargs = dict(
+            wall_width=8.0,
+            wall_height=12.0,
+            wall_thickness=0.8,
+            num_floors=4,
+            floor_height=3.0,
+            windows_per_floor=3,
+            window_width=0.5,
+            window_height=0.7,
+        )
+        cuts = window_grid_cutouts(**kwargs)
+        stencil = window_stencil(**kwargs)
+        assert stencil.volume() == pytest.approx(sum(c.volume() for c in cuts))
+        assert stencil.num_tri() == sum(c.num_tri() for c in cuts)
+
+    def test_window_stencil_narrow_wall_unions(self):
+        # Spacing 6 / 3 = 2.0 < window width 2.5, so neighbours overlap
+        kwargs = dict(
+            wall_width=6.0,
+            wall_height=15.0,
+            wall_thickness=0.8,
+            num_floors=3,
+            floor_height=5.0,
+            windows_per_floor=2,
+            window_width=2.5,
+            window_height=3.0,
+        )
+        cuts = window_grid_cutouts(**kwargs)
+        stencil = window_stencil(**kwargs)
+        assert stencil.status() == Error.NoError
+        assert stencil.volume() == pytest.approx(union_all(cuts).volume())
+        assert stencil.volume() < sum(c.volume() for c in cuts)
+
+    def test_window_stencil_empty(self):
+        stencil = window_stencil(
+            wall_width=8.0,
+            wall_height=3.0,
+            wall_thickness=0.8,
+            num_floors=1,
+            floor_height=3.0,
+            windows_per_floor=3,
+            window_width=0.5,
+            window_height=0.7,
+        )
+        assert stencil.is_empty()
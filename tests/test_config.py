@@ -39,6 +39,12 @@ class TestPrinterProfile:
         with pytest.raises(InvalidParamsError):
             PrinterProfile.from_type("sla")
 
+    def test_from_type_shared_and_frozen(self):
+        p = PrinterProfile.from_type("fdm")
+        assert PrinterProfile.from_type("fdm") is p
+        with pytest.raises(AttributeError):
+            p.min_wall_thickness = 1.0
+
 
 class TestBuildingParams:
     def test_valid_params(self):
@@ -105,10 +111,10 @@ class TestBuildingPlacement:
         assert p.rotation == 0.0
         assert p.role == "main"
 
-    def test_valid_roles(self):
-        for role in ("main", "wing", "annex", "tower", "pavilion"):
-            p = BuildingPlacement(role=role)
-            assert p.role == role
+    @pytest.mark.parametrize("role", ["main", "wing", "annex", "tower", "pavilion"])
+    def test_valid_roles(self, role):
+        p = BuildingPlacement(role=role)
+        assert p.role == role
 
     def test_invalid_role(self):
         with pytest.raises((ValidationError, InvalidParamsError)):
@@ -135,10 +141,10 @@ class TestComplexParams:
         assert p.placements is None
         assert p.preset is None
 
-    def test_valid_range(self):
-        for n in range(1, 7):
-            p = ComplexParams(style_name="modern", num_buildings=n)
-            assert p.num_buildings == n
+    @pytest.mark.parametrize("n", range(1, 7))
+    def test_valid_range(self, n):
+        p = ComplexParams(style_name="modern", num_buildings=n)
+        assert p.num_buildings == n
 
     def test_too_many_buildings(self):
         with pytest.raises((ValidationError, InvalidParamsError)):
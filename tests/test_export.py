@@ -1,5 +1,7 @@
 """Tests for export pipeline and validation checks."""
 
+import io
+
 import pytest
 import trimesh
 
@@ -24,7 +26,6 @@ class TestSTLExport:
         assert len(data) > 80  # STL header is 80 bytes
 
     def test_stl_roundtrip(self):
-        import io
         b = box(5, 4, 10)
         data = export_stl_bytes(b)
         reimported = trimesh.load(io.BytesIO(data), file_type="stl")
@@ -39,12 +40,16 @@ class TestGLBExport:
         assert len(data) > 0
 
     def test_glb_roundtrip(self):
-        import io
         b = box(5, 4, 10)
         data = export_glb_bytes(b)
         scene = trimesh.load(io.BytesIO(data), file_type="glb")
         assert scene is not None
 
+    def test_glb_mesh_named_hotel(self):
+        data = export_glb_bytes(box(5, 4, 10))
+        scene = trimesh.load(io.BytesIO(data), file_type="glb")
+        assert list(scene.geometry) == ["hotel"]
+
 
 class TestValidation:
     def test_valid_box(self):
@@ -64,3 +69,9 @@ class TestValidation:
         b = box(5, 4, 10)
         result = validate_manifold(b)
         assert result["reasonable_size"]
+
+    def test_size_and_degenerate_checks(self):
+        result = validate_manifold(box(4, 4, 10))
+        assert result["no_degenerate_triangles"] is True
+        assert result["not_too_small"] is False  # only 1 dimension >= 5mm
+        assert validate_manifold(box(130, 6, 10))["reasonable_size"] is False
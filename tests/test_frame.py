@@ -15,6 +15,28 @@ from hotel_generator.board.frame import (
 from hotel_generator.board.road import generate_road_layout
 
 
+# Frame generation only reads the slots, so one layout per shape is shared
+# across the module.
+@pytest.fixture(scope="module")
+def loop_slots():
+    return generate_road_layout("loop", 8, 100.0, 80.0, 8.0, random.Random(42))
+
+
+@pytest.fixture(scope="module")
+def linear_slots():
+    return generate_road_layout("linear", 8, 100.0, 80.0, 8.0, random.Random(42))
+
+
+@pytest.fixture(scope="module")
+def loop_frame(loop_slots):
+    return generate_frame(loop_slots, BoardParams(road_shape="loop"))
+
+
+@pytest.fixture(scope="module")
+def linear_frame(linear_slots):
+    return generate_frame(linear_slots, BoardParams(road_shape="linear"))
+
+
 # ---------------------------------------------------------------------------
 # Individual piece geometry
 # ---------------------------------------------------------------------------
@@ -70,61 +92,45 @@ class TestFrameRail:
 
 
 class TestLoopFrame:
-    def _make_loop_slots(self, n=8):
-        rng = random.Random(42)
-        return generate_road_layout("loop", n, 100.0, 80.0, 8.0, rng)
-
-    def test_loop_produces_pieces(self):
-        slots = self._make_loop_slots()
-        params = BoardParams(road_shape="loop")
-        result = generate_frame(slots, params)
+    def test_loop_produces_pieces(self, loop_frame):
+        result = loop_frame
         assert len(result.all_pieces) > 0
 
-    def test_loop_has_road_fillers(self):
-        slots = self._make_loop_slots()
-        params = BoardParams(road_shape="loop")
-        result = generate_frame(slots, params)
+    def test_loop_has_road_fillers(self, loop_frame):
+        result = loop_frame
         assert len(result.road_fillers) > 0
         for piece in result.road_fillers:
             assert piece.piece_type == "road_filler"
             assert not piece.manifold.is_empty()
 
-    def test_loop_has_corners(self):
-        slots = self._make_loop_slots()
-        params = BoardParams(road_shape="loop")
-        result = generate_frame(slots, params)
+    def test_loop_has_corners(self, loop_frame):
+        result = loop_frame
         assert len(result.road_corners) > 0
         for piece in result.road_corners:
             assert piece.piece_type == "road_corner"
             assert not piece.manifold.is_empty()
 
-    def test_loop_has_side_roads(self):
-        slots = self._make_loop_slots()
-        params = BoardParams(road_shape="loop")
-        result = generate_frame(slots, params)
+    def test_loop_has_side_roads(self, loop_frame):
+        result = loop_frame
         assert len(result.road_sides) > 0
         for piece in result.road_sides:
             assert piece.piece_type == "road_side"
             assert not piece.manifold.is_empty()
 
-    def test_loop_has_frame_rails(self):
-        slots = self._make_loop_slots()
-        params = BoardParams(road_shape="loop")
-        result = generate_frame(slots, params)
+    def test_loop_has_frame_rails(self, loop_frame):
+        result = loop_frame
         assert len(result.frame_rails) > 0
         for piece in result.frame_rails:
             assert piece.piece_type == "frame_rail"
             assert not piece.manifold.is_empty()
 
-    def test_all_pieces_positive_volume(self):
-        slots = self._make_loop_slots()
-        params = BoardParams(road_shape="loop")
-        result = generate_frame(slots, params)
+    def test_all_pieces_positive_volume(self, loop_frame):
+        result = loop_frame
         for piece in result.all_pieces:
             assert piece.manifold.volume() > 0, f"{piece.label} has zero volume"
 
-    def test_disabled_frame(self):
-        slots = self._make_loop_slots()
+    def test_disabled_frame(self, loop_slots):
+        slots = loop_slots
         params = BoardParams(road_shape="loop", frame=FrameParams(enabled=False))
         result = generate_frame(slots, params)
         assert len(result.all_pieces) == 0
@@ -136,33 +142,21 @@ class TestLoopFrame:
 
 
 class TestLinearFrame:
-    def _make_linear_slots(self, n=8):
-        rng = random.Random(42)
-        return generate_road_layout("linear", n, 100.0, 80.0, 8.0, rng)
-
-    def test_linear_produces_pieces(self):
-        slots = self._make_linear_slots()
-        params = BoardParams(road_shape="linear")
-        result = generate_frame(slots, params)
+    def test_linear_produces_pieces(self, linear_frame):
+        result = linear_frame
         assert len(result.all_pieces) > 0
 
-    def test_linear_has_road_fillers(self):
-        slots = self._make_linear_slots()
-        params = BoardParams(road_shape="linear")
-        result = generate_frame(slots, params)
+    def test_linear_has_road_fillers(self, linear_frame):
+        result = linear_frame
         assert len(result.road_fillers) > 0
 
-    def test_linear_no_corners(self):
+    def test_linear_no_corners(self, linear_frame):
         """Linear layout has no road corners."""
-        slots = self._make_linear_slots()
-        params = BoardParams(road_shape="linear")
-        result = generate_frame(slots, params)
+        result = linear_frame
         assert len(result.road_corners) == 0
 
-    def test_linear_has_frame_rails(self):
-        slots = self._make_linear_slots()
-        params = BoardParams(road_shape="linear")
-        result = generate_frame(slots, params)
+    def test_linear_has_frame_rails(self, linear_frame):
+        result = linear_frame
         assert len(result.frame_rails) > 0
 
 
@@ -182,25 +176,22 @@ class TestSerpentineFrame:
 
 
 class TestDualSidedLoop:
-    def test_loop_8_has_4_rows(self):
+    def test_loop_8_has_4_rows(self, loop_slots):
         """8 properties in loop should produce 4 rows."""
-        rng = random.Random(42)
-        slots = generate_road_layout("loop", 8, 100.0, 80.0, 8.0, rng)
+        slots = loop_slots
         ys = sorted(set(round(s.center_y, 1) for s in slots))
         assert len(ys) == 4, f"Expected 4 rows, got {len(ys)}: {ys}"
 
-    def test_loop_has_both_road_edges(self):
+    def test_loop_has_both_road_edges(self, loop_slots):
         """Both north and south road edges should be present."""
-        rng = random.Random(42)
-        slots = generate_road_layout("loop", 8, 100.0, 80.0, 8.0, rng)
+        slots = loop_slots
         edges = set(s.road_edge for s in slots)
         assert "north" in edges
         assert "south" in edges
 
-    def test_properties_face_each_other(self):
+    def test_properties_face_each_other(self, loop_slots):
         """Adjacent rows should have properties facing toward the road between them."""
-        rng = random.Random(42)
-        slots = generate_road_layout("loop", 8, 100.0, 80.0, 8.0, rng)
+        slots = loop_slots
         # Sort by y
         ys = sorted(set(round(s.center_y, 1) for s in slots))
         for i in range(len(ys) - 1):
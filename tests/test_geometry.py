@@ -6,6 +6,7 @@ from manifold3d import Manifold
 from hotel_generator.errors import GeometryError
 from hotel_generator.geometry.primitives import (
     box,
+    box_at,
     cylinder,
     cone,
     extrude_polygon,
@@ -24,6 +25,8 @@ from hotel_generator.geometry.transforms import (
     mirror_x,
     mirror_y,
     safe_scale,
+    compose_transform,
+    transform,
 )
 
 
@@ -59,6 +62,16 @@ class TestBox:
         with pytest.raises(GeometryError):
             box(1, 1, -1)
 
+    def test_box_at_position(self):
+        b = box_at(4, 6, 2, x=10, y=-5, z=3)
+        min_x, min_y, min_z, max_x, max_y, max_z = b.bounding_box()
+        assert (min_x, min_y, min_z) == pytest.approx((8, -8, 3))
+        assert (max_x, max_y, max_z) == pytest.approx((12, -2, 5))
+
+    def test_box_at_zero_depth_raises(self):
+        with pytest.raises(GeometryError):
+            box_at(1, 0, 1, x=2)
+
 
 class TestCylinder:
     def test_valid_cylinder(self):
@@ -189,6 +202,20 @@ class TestTransforms:
         assert not r.is_empty()
         assert abs(r.volume() - b.volume()) < 0.01
 
+    def test_rotate_z_fractional_angle(self):
+        b = box(2, 1, 1)
+        r = rotate_z(b, 45.5)
+        assert abs(r.volume() - b.volume()) < 0.01
+        min_x, min_y, min_z, max_x, max_y, max_z = r.bounding_box()
+        assert max_x - min_x > 2.0  # rotated AABB is wider than the box
+
+    def test_compose_transform_matches_rotate_then_translate(self):
+        b = box(10, 4, 3)
+        for degrees in (0, 90, 180, 270, 30):
+            expected = translate(rotate_z(b, degrees), 5, 7)
+            actual = transform(b, compose_transform(5, 7, rz=degrees))
+            assert actual.bounding_box() == pytest.approx(expected.bounding_box())
+
     def test_mirror_x(self):
         b = box(2, 1, 1).translate([5, 0, 0])
         m = mirror_x(b)
@@ -207,6 +234,11 @@ class TestTransforms:
         assert not s.is_empty()
         assert abs(s.volume() - 8.0) < 0.01
 
+    def test_identity_transforms_return_input(self):
+        b = box(1, 1, 1)
+        assert safe_scale(b) is b
+        assert translate(b) is b
+
     def test_safe_scale_non_uniform(self):
         b = box(1, 1, 1)
         s = safe_scale(b, 2, 3, 4)
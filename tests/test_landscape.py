@@ -99,23 +99,14 @@ class TestHedgeRow:
 # ---------------------------------------------------------------------------
 
 class TestSwimmingPool:
-    def test_rectangular(self):
-        rim, recess = swimming_pool(shape="rectangular")
+    @pytest.mark.parametrize("shape", ["rectangular", "kidney", "l_shaped"])
+    def test_shape_valid(self, shape):
+        rim, recess = swimming_pool(shape=shape)
         assert not rim.is_empty()
         assert not recess.is_empty()
         assert rim.volume() > 0
         assert recess.volume() > 0
 
-    def test_kidney(self):
-        rim, recess = swimming_pool(shape="kidney")
-        assert not rim.is_empty()
-        assert not recess.is_empty()
-
-    def test_l_shaped(self):
-        rim, recess = swimming_pool(shape="l_shaped")
-        assert not rim.is_empty()
-        assert not recess.is_empty()
-
     def test_unknown_shape_raises(self):
         with pytest.raises(GeometryError, match="Unknown pool shape"):
             swimming_pool(shape="hexagonal")
@@ -13,6 +13,7 @@ from hotel_generator.layout.placement import (
     any_overlaps,
     compute_lot_bounds,
     footprints_fit_lot,
+    footprints_table,
 )
 from hotel_generator.layout.strategies import (
     STRATEGIES,
@@ -55,6 +56,18 @@ class TestBuildingFootprint:
         assert f.width == pytest.approx(6)
         assert f.depth == pytest.approx(10)
 
+    def test_table_matches_placement_footprint(self):
+        ps = [
+            BuildingPlacement(x=0, y=0, width=10, depth=6),
+            BuildingPlacement(x=10, y=5, width=10, depth=6, rotation=90),
+            BuildingPlacement(x=-3, y=2, width=4, depth=8, rotation=270),
+        ]
+        table = footprints_table(ps)
+        assert table.shape == (3, 4)
+        for row, p in zip(table, ps):
+            f = placement_footprint(p)
+            assert tuple(row) == pytest.approx((f.min_x, f.min_y, f.max_x, f.max_y))
+
 
 class TestOverlapDetection:
     def test_no_overlap(self):
@@ -88,6 +101,17 @@ class TestOverlapDetection:
         ]
         assert any_overlaps(ps)
 
+    def test_any_overlaps_large_grid(self):
+        ps = [
+            BuildingPlacement(x=col * 15, y=row * 12, width=10, depth=8)
+            for row in range(5)
+            for col in range(5)
+        ]
+        assert not any_overlaps(ps)
+        assert any_overlaps(ps, margin=6)
+        ps.append(BuildingPlacement(x=37, y=30, width=10, depth=8))
+        assert any_overlaps(ps)
+
 
 class TestLotBounds:
     def test_compute_bounds(self):
@@ -112,19 +136,17 @@ class TestStrategies:
     def strategy_name(self, request):
         return request.param
 
-    def test_correct_count(self, strategy_name):
+    @pytest.mark.parametrize("n", range(1, 7))
+    def test_correct_count(self, strategy_name, n):
         fn = STRATEGIES[strategy_name]
-        rng = random.Random(42)
-        for n in range(1, 7):
-            result = fn(n, rng, 30.0, 25.0, 4, 5.0, 5.0)
-            assert len(result) == n, f"{strategy_name} with {n} buildings returned {len(result)}"
+        result = fn(n, random.Random(42), 30.0, 25.0, 4, 5.0, 5.0)
+        assert len(result) == n, f"{strategy_name} with {n} buildings returned {len(result)}"
 
-    def test_no_overlaps(self, strategy_name):
+    @pytest.mark.parametrize("n", range(1, 7))
+    def test_no_overlaps(self, strategy_name, n):
         fn = STRATEGIES[strategy_name]
-        rng = random.Random(42)
-        for n in range(1, 7):
-            result = fn(n, rng, 30.0, 25.0, 4, 5.0, 5.0)
-            assert not any_overlaps(result), f"{strategy_name} with {n} has overlaps"
+        result = fn(n, random.Random(42), 30.0, 25.0, 4, 5.0, 5.0)
+        assert not any_overlaps(result), f"{strategy_name} with {n} has overlaps"
 
     def test_seed_variation(self, strategy_name):
         fn = STRATEGIES[strategy_name]
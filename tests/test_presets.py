@@ -14,24 +14,44 @@ from hotel_generator.settings import Settings
 from hotel_generator.styles.base import STYLE_REGISTRY
 
 
+@pytest.fixture(scope="module")
+def builder():
+    return ComplexBuilder(Settings())
+
+
+@pytest.fixture(scope="module", params=sorted(PRESET_REGISTRY))
+def preset_name(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def built_preset(builder, preset_name):
+    """Complex built once per preset, shared by every test that reads it."""
+    return builder.build(ComplexParams(
+        style_name="modern",  # will be overridden by preset
+        preset=preset_name,
+        num_buildings=PRESET_REGISTRY[preset_name].num_buildings,
+    ))
+
+
 class TestPresetRegistry:
     def test_all_presets_registered(self):
         expected = {"royal", "fujiyama", "waikiki", "president",
                     "safari", "taj_mahal", "letoile", "boomerang", "vacation"}
         assert set(PRESET_REGISTRY.keys()) == expected
 
-    def test_valid_styles(self):
-        for name, preset in PRESET_REGISTRY.items():
-            assert preset.style_name in STYLE_REGISTRY, (
-                f"Preset '{name}' references unknown style '{preset.style_name}'"
-            )
+    def test_valid_styles(self, preset_name):
+        preset = PRESET_REGISTRY[preset_name]
+        assert preset.style_name in STYLE_REGISTRY, (
+            f"Preset '{preset_name}' references unknown style '{preset.style_name}'"
+        )
 
-    def test_roles_match_count(self):
-        for name, preset in PRESET_REGISTRY.items():
-            assert len(preset.building_roles) == preset.num_buildings, (
-                f"Preset '{name}': {len(preset.building_roles)} roles "
-                f"but {preset.num_buildings} buildings"
-            )
+    def test_roles_match_count(self, preset_name):
+        preset = PRESET_REGISTRY[preset_name]
+        assert len(preset.building_roles) == preset.num_buildings, (
+            f"Preset '{preset_name}': {len(preset.building_roles)} roles "
+            f"but {preset.num_buildings} buildings"
+        )
 
     def test_list_presets(self):
         presets = list_presets()
@@ -51,18 +71,8 @@ class TestPresetRegistry:
 
 
 class TestPresetGeneration:
-    @pytest.fixture
-    def builder(self):
-        return ComplexBuilder(Settings())
-
-    @pytest.mark.parametrize("preset_name", list(PRESET_REGISTRY.keys()))
-    def test_preset_generates_valid_complex(self, builder, preset_name):
-        params = ComplexParams(
-            style_name="modern",  # will be overridden by preset
-            preset=preset_name,
-            num_buildings=PRESET_REGISTRY[preset_name].num_buildings,
-        )
-        result = builder.build(params)
+    def test_preset_generates_valid_complex(self, built_preset, preset_name):
+        result = built_preset
         assert len(result.buildings) == PRESET_REGISTRY[preset_name].num_buildings
         for b in result.buildings:
             assert b.is_watertight
@@ -1,10 +1,18 @@
 """Tests for style system and individual styles."""
 
 import pytest
+from manifold3d import Error, Manifold
 
+from hotel_generator.components.scale import ScaleContext
 from hotel_generator.config import BuildingParams, PrinterProfile
 from hotel_generator.errors import InvalidParamsError
-from hotel_generator.styles.base import STYLE_REGISTRY, list_styles, assemble_building
+from hotel_generator.styles.base import (
+    STYLE_REGISTRY,
+    list_styles,
+    assemble_building,
+    generate_cached,
+    clear_generate_cache,
+)
 from hotel_generator.geometry.primitives import box
 
 
@@ -18,6 +26,10 @@ class TestStyleRegistry:
         names = [s["name"] for s in styles]
         assert "modern" in names
 
+    def test_list_styles_is_reused(self):
+        assert list_styles() is list_styles()
+        assert len(list_styles()) == len(STYLE_REGISTRY)
+
     def test_style_has_required_properties(self):
         style = STYLE_REGISTRY["modern"]
         assert style.name == "modern"
@@ -25,6 +37,29 @@ class TestStyleRegistry:
         assert style.description
 
 
+class TestGenerateCache:
+    def test_identical_inputs_reuse_result(self):
+        clear_generate_cache()
+        style = STYLE_REGISTRY["modern"]
+        profile = PrinterProfile.fdm()
+        params = BuildingParams(style_name="modern", num_floors=3)
+        first, hit = generate_cached(style, params, profile)
+        assert not hit
+        again, hit = generate_cached(style, params.model_copy(), profile)
+        assert hit
+        assert again is first
+
+    def test_different_params_miss(self):
+        clear_generate_cache()
+        style = STYLE_REGISTRY["modern"]
+        profile = PrinterProfile.fdm()
+        a, _ = generate_cached(style, BuildingParams(style_name="modern", width=30.0), profile)
+        b, hit = generate_cached(style, BuildingParams(style_name="modern", width=36.0), profile)
+        assert not hit
+        assert a is not b
+        assert b.volume() > a.volume()
+
+
 class TestAssembleBuilding:
     def test_basic_assembly(self):
         shell = box(10, 8, 15)
@@ -102,3 +137,23 @@ class TestModernStyle:
         m1 = style.generate(params, profile)
         m2 = style.generate(params, profile)
         assert abs(m1.volume() - m2.volume()) < 0.01
+
+
+class TestArtDecoStyle:
+    @pytest.mark.parametrize(
+        "width, depth, floor_height",
+        [(6.0, 25.0, 10.0), (3.0, 6.0, 2.0)],  # overlapping, touching fins
+    )
+    def test_crowded_fins_valid(self, width, depth, floor_height):
+        style = STYLE_REGISTRY["art_deco"]
+        params = BuildingParams(
+            style_name="art_deco", width=width, depth=depth, floor_height=floor_height
+        )
+        profile = PrinterProfile.fdm()
+        sc = ScaleContext(width, depth, floor_height, max(params.num_floors, 6), profile)
+        assert width / 5 <= sc.fin_thickness  # fin pitch leaves no gap
+        m = style.generate(params, profile)
+        assert m.status() == Error.NoError
+        assert m.volume() > 0
+        reloaded = Manifold(m.to_mesh())
+        assert reloaded.status() == Error.NoError